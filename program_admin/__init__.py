@@ -1,21 +1,40 @@
 import asyncio
-import json
+import base64
 import os
+import random
+import time
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from loguru import logger
 from solana import system_program
+from solana.blockhash import Blockhash
 from solana.keypair import Keypair
 from solana.publickey import PublicKey
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Commitment
-from solana.rpc.types import TxOpts
+from solana.rpc.commitment import Commitment, Confirmed, Processed
+from solana.rpc.core import RPCException
+from solana.rpc.types import DataSliceOpts
 from solana.transaction import PACKET_DATA_SIZE, Transaction, TransactionInstruction
+from solders.rpc.responses import GetProgramAccountsResp  # pylint: disable=import-error
 
 from program_admin import instructions as pyth_program
-from program_admin.keys import load_keypair
-from program_admin.parsing import parse_account
+from program_admin.keys import load_keypair, read_keypair
+from program_admin.parsing import MAPPING_FIELDS, parse_account, parse_account_info
 from program_admin.price_store_instructions import (
     config_account_pubkey as price_store_config_account_pubkey,
 )
@@ -26,7 +45,9 @@ from program_admin.price_store_instructions import (
     publisher_config_account_pubkey,
 )
 from program_admin.types import (
+    MappingData,
     Network,
+    PythAccount,
     PythAuthorityPermissionAccount,
     PythMappingAccount,
     PythPriceAccount,
@@ -37,13 +58,15 @@ from program_admin.types import (
     ReferencePublishers,
 )
 from program_admin.util import (
+    EMPTY_TRANSACTION_SIZE,
     MAPPING_ACCOUNT_SIZE,
     PRICE_ACCOUNT_V1_SIZE,
     PRICE_ACCOUNT_V2_SIZE,
     PRODUCT_ACCOUNT_SIZE,
+    ZERO_PUBLIC_KEY,
     account_exists,
-    compute_transaction_size,
-    get_actual_signers,
+    compute_instruction_size,
+    get_permissions_account,
     recent_blockhash,
     sort_mapping_account_keys,
 )
@@ -58,18 +81,102 @@ RPC_ENDPOINTS: Dict[Network, str] = {
 }
 
 MAX_CONCURRENT_TRANSACTIONS = 50
+MAX_CONCURRENT_SYNCS = 8
+MAX_MULTIPLE_ACCOUNTS = 100  # getMultipleAccounts limit
+# Stays well under the default httpx connection pool size (100), so requests
+# wait here rather than in the pool, and public RPC rate limits are respected
+MAX_CONCURRENT_RPC_REQUESTS = 16
+MAX_SIGNATURE_STATUSES = 256  # getSignatureStatuses limit
+MAX_RATE_LIMIT_RETRIES = 4
+RATE_LIMIT_RETRY_DELAY = 0.5
+
+# Transactions expire with their blockhash after ~150 slots
+CONFIRMATION_TIMEOUT = 90.0
+# A reused blockhash must leave enough of its lifetime for confirmation
+BLOCKHASH_MAX_AGE = 10.0
+CONFIRMATION_POLL_INTERVAL = 0.5
+COMMITMENT_LEVELS = ["processed", "confirmed", "finalized"]
+# Account reads only decide which instructions to build, so they don't wait for
+# finalization (~13 slots later). Transactions are still confirmed at the admin
+# commitment level, which is never lower than this.
+READ_COMMITMENT = Confirmed
+
+T = TypeVar("T")
+
+# (program key, mapping account key) pairs of the mapping accounts that are
+# synced outside of test mode
+REFERENCE_PAIRS: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        (
+            "gSbePebfvPy7tRqimPoVecS2UsBvYv46ynrzWocc92s",
+            "BmA9Z6FjioHJPpjT39QazZyhDRUdZy2ezwx4GiDdE2u2",
+        ),
+        (
+            "8tfDNiaEyrV6Q1U4DEXrEigs9DoDtkugzFbybENEbCDz",
+            "AFmdnt9ng1uVxqCmqwQJDAYC5cKTkw8gJKSM5PnzuF6z",
+        ),
+        (
+            "FsJ3A3u2vn5cTVofAjvy6y5kwABJAqYWpe4975bi2epH",
+            "AHtgzX45WTKfkPG53L6WYhGEXwQkN1BVknET3sVsLL8J",
+        ),
+    }
+)
+
+# Allocated sizes of the mapping, product and price accounts in the program
+PROGRAM_ACCOUNT_SIZES = [
+    MAPPING_ACCOUNT_SIZE,
+    PRODUCT_ACCOUNT_SIZE,
+    PRICE_ACCOUNT_V1_SIZE,
+    PRICE_ACCOUNT_V2_SIZE,
+]
 
 
 class ProgramAdmin:
+    __slots__ = (
+        "network",
+        "rpc_endpoint",
+        "read_rpc_endpoint",
+        "key_dir",
+        "program_key",
+        "_program_key_str",
+        "price_store_key",
+        "commitment",
+        "authority_permission_account",
+        "_mapping_accounts",
+        "_product_accounts",
+        "_price_accounts",
+        "_mapping_chain",
+        "_client",
+        "_read_client",
+        "_has_written",
+        "max_concurrent_requests",
+        "_rpc_semaphore",
+        "_blockhash",
+        "_rent_cache",
+        "_keypair_cache",
+    )
+
     network: Network
     rpc_endpoint: str
+    read_rpc_endpoint: str
     key_dir: Path
     program_key: PublicKey
+    _program_key_str: str
     price_store_key: Optional[PublicKey]
+    commitment: Commitment
     authority_permission_account: Optional[PythAuthorityPermissionAccount]
     _mapping_accounts: Dict[PublicKey, PythMappingAccount]
     _product_accounts: Dict[PublicKey, PythProductAccount]
     _price_accounts: Dict[PublicKey, PythPriceAccount]
+    _mapping_chain: Optional[List[PublicKey]]
+    _client: Optional[AsyncClient]
+    _read_client: Optional[AsyncClient]
+    _has_written: bool
+    max_concurrent_requests: int
+    _rpc_semaphore: Optional[asyncio.Semaphore]
+    _blockhash: Optional[Tuple[Blockhash, float]]
+    _rent_cache: Dict[int, "asyncio.Future[int]"]
+    _keypair_cache: Dict[Union[str, PublicKey], Keypair]
 
     def __init__(
         self,
@@ -79,17 +186,31 @@ class ProgramAdmin:
         price_store_key: Optional[str],
         commitment: Literal["confirmed", "finalized"],
         rpc_endpoint: str = "",
+        read_rpc_endpoint: str = "",
+        max_concurrent_requests: int = MAX_CONCURRENT_RPC_REQUESTS,
     ):
         self.network = network
         self.rpc_endpoint = rpc_endpoint or RPC_ENDPOINTS[network]
+        self.read_rpc_endpoint = read_rpc_endpoint
         self.key_dir = Path(key_dir)
         self.program_key = PublicKey(program_key)
+        # Base58 encoding is not free, and the key is compared as a string
+        self._program_key_str = str(self.program_key)
         self.price_store_key = PublicKey(price_store_key) if price_store_key else None
         self.commitment = Commitment(commitment)
         self.authority_permission_account = None
         self._mapping_accounts: Dict[PublicKey, PythMappingAccount] = {}
         self._product_accounts: Dict[PublicKey, PythProductAccount] = {}
         self._price_accounts: Dict[PublicKey, PythPriceAccount] = {}
+        self._mapping_chain = None
+        self._client = None
+        self._read_client = None
+        self._has_written = False
+        self.max_concurrent_requests = max_concurrent_requests
+        self._rpc_semaphore = None
+        self._blockhash = None
+        self._rent_cache: Dict[int, "asyncio.Future[int]"] = {}
+        self._keypair_cache: Dict[Union[str, PublicKey], Keypair] = {}
 
     def get_mapping_account(self, key: PublicKey) -> PythMappingAccount:
         return self._mapping_accounts[key]
@@ -100,285 +221,1053 @@ class ProgramAdmin:
     def get_product_account(self, key: PublicKey) -> PythProductAccount:
         return self._product_accounts[key]
 
+    def get_mapping_chain(self) -> List[PublicKey]:
+        """
+        Return the mapping account keys in linked list order. The result is
+        cached until mapping accounts are refreshed.
+        """
+        if self._mapping_chain is None:
+            self._mapping_chain = sort_mapping_account_keys(
+                self._mapping_accounts.values()
+            )
+
+        return self._mapping_chain
+
     def get_first_mapping_key(self) -> PublicKey:
-        mapping_chain = sort_mapping_account_keys(list(self._mapping_accounts.values()))
+        return self.get_mapping_chain()[0]
+
+    async def _get_client(self) -> AsyncClient:
+        """
+        Return the RPC client shared by all requests, creating it on first use.
+        """
+        if self._client is None:
+            self._client = AsyncClient(self.rpc_endpoint)
+
+        return self._client
+
+    async def close(self):
+        """
+        Close the shared RPC clients (new ones are created on the next request).
+        """
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+        if self._read_client is not None:
+            await self._read_client.close()
+            self._read_client = None
+
+        # Semaphores are bound to the event loop they are first used in
+        self._rpc_semaphore = None
+
+    async def _rpc(self, request: Awaitable[T]) -> T:
+        """
+        Await an RPC request, with at most max_concurrent_requests in flight.
+        """
+        if self._rpc_semaphore is None:
+            self._rpc_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async with self._rpc_semaphore:
+            return await request
+
+    async def _read(self, request: Callable[[AsyncClient], Awaitable[T]]) -> T:
+        """
+        Await a read-only RPC request. When a read endpoint is configured, the
+        request is hedged: it is sent to both endpoints, the first successful
+        response is returned and the other request is cancelled. Transactions
+        are only ever sent to the main endpoint.
+
+        Once a transaction has been sent, reads only go to the main endpoint:
+        the read endpoint may lag behind it and miss the accounts just written.
+        Before that, a hedged read may still be answered from a slot a little
+        older than the main endpoint's. Such reads only decide which
+        instructions to build, so a lagging answer either builds an
+        instruction the program rejects (e.g. adding a publisher that was just
+        added elsewhere), which fails the send, or skips a change that the
+        next sync then makes.
+        """
+        client = await self._get_client()
+
+        if not self.read_rpc_endpoint or self._has_written:
+            return await self._rpc(request(client))
+
+        if self._read_client is None:
+            self._read_client = AsyncClient(self.read_rpc_endpoint)
+
+        pending = {
+            asyncio.ensure_future(self._rpc(request(client))),
+            asyncio.ensure_future(self._rpc(request(self._read_client))),
+        }
+        errors: List[BaseException] = []
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    error = task.exception()
 
-        return mapping_chain[0]
+                    if error is None:
+                        return task.result()
+
+                    errors.append(error)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Both endpoints failed
+        raise errors[-1]
+
+    async def _account_exists(self, key: PublicKey) -> bool:
+        return await self._read(lambda client: account_exists(client, key))
+
+    async def _existing_account_keys(self, keys: List[PublicKey]) -> Set[PublicKey]:
+        """
+        Return which of the given accounts exist, using getMultipleAccounts
+        with an empty data slice so that no account data is transferred.
+        """
+        chunks = [
+            keys[i : i + MAX_MULTIPLE_ACCOUNTS]
+            for i in range(0, len(keys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        responses = await asyncio.gather(
+            *[
+                self._read(
+                    lambda client, chunk=chunk: client.get_multiple_accounts(
+                        chunk,
+                        encoding="base64",
+                        data_slice=DataSliceOpts(offset=0, length=0),
+                    )
+                )
+                for chunk in chunks
+            ]
+        )
+
+        return {
+            key
+            for chunk, response in zip(chunks, responses)
+            for key, account in zip(chunk, response.value)
+            if account
+        }
+
+    async def _get_recent_blockhash(self) -> Blockhash:
+        """
+        Return a recent blockhash, reusing the last one fetched while it is
+        younger than BLOCKHASH_MAX_AGE seconds.
+        """
+        if self._blockhash is None or (
+            time.monotonic() - self._blockhash[1] > BLOCKHASH_MAX_AGE
+        ):
+            client = await self._get_client()
+            self._blockhash = (
+                await self._rpc(recent_blockhash(client)),
+                time.monotonic(),
+            )
+
+        return self._blockhash[0]
+
+    async def __aenter__(self) -> "ProgramAdmin":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    def _load_keypair(
+        self, label_or_pubkey: Union[str, PublicKey], generate: bool = False
+    ) -> Keypair:
+        """
+        Read a keypair from the keys directory, caching it for later lookups.
+        """
+        if label_or_pubkey not in self._keypair_cache:
+            self._keypair_cache[label_or_pubkey] = load_keypair(
+                label_or_pubkey, key_dir=self.key_dir, generate=generate
+            )
+
+        return self._keypair_cache[label_or_pubkey]
+
+    def _load_symbol_keypairs(
+        self, jump_symbol: str, generate: bool
+    ) -> Tuple[Keypair, Keypair]:
+        """
+        Read (or generate) the product and price keypairs of a symbol.
+        """
+        return (
+            self._load_keypair(f"product_{jump_symbol}", generate),
+            self._load_keypair(f"price_{jump_symbol}", generate),
+        )
 
     async def fetch_minimum_balance(self, size: int) -> int:
         """
         Return the minimum balance in lamports for a new account to be rent-exempt.
+        Results are cached by size (rent parameters only change with cluster
+        upgrades), and concurrent lookups of the same size share a single request.
+        """
+        if size not in self._rent_cache:
+            self._rent_cache[size] = asyncio.ensure_future(
+                self._request_minimum_balance(size)
+            )
+
+        try:
+            # Shielded so that a cancelled caller doesn't cancel other waiters
+            return await asyncio.shield(self._rent_cache[size])
+        except Exception:
+            # Don't cache failures, the next lookup retries the request
+            self._rent_cache.pop(size, None)
+            raise
+
+    async def _prefetch_rent(self):
+        """
+        Warm the rent cache for every account size sync may create.
+        """
+        await asyncio.gather(
+            *[self.fetch_minimum_balance(size) for size in PROGRAM_ACCOUNT_SIZES]
+        )
+
+    async def _request_minimum_balance(self, size: int) -> int:
+        # Rent parameters only change with cluster upgrades
+        response = await self._read(
+            lambda client: client.get_minimum_balance_for_rent_exemption(
+                size, commitment=Processed
+            )
+        )
+
+        return response.value
+
+    def _reference_mapping_keys(self) -> Set[str]:
         """
-        async with AsyncClient(self.rpc_endpoint) as client:
-            return (await client.get_minimum_balance_for_rent_exemption(size)).value
+        Return the keys of the mapping accounts synced for this program outside
+        of test mode.
+        """
+        program_key = os.environ.get("PROGRAM_KEY") or self._program_key_str
+
+        return {
+            mapping_key
+            for (pair_program_key, mapping_key) in REFERENCE_PAIRS
+            if pair_program_key == program_key
+        }
+
+    def _store_accounts(self, accounts: Iterable[Optional[PythAccount]]):
+        test_mode = os.environ.get("TEST_MODE")
+        reference_mapping_keys = self._reference_mapping_keys()
+
+        # Product and price accounts (the bulk of the records) are stored as-is,
+        # so dispatch them on their exact type with a single lookup.
+        account_dicts: Dict[type, Dict[PublicKey, Any]] = {
+            PythProductAccount: self._product_accounts,
+            PythPriceAccount: self._price_accounts,
+        }
+
+        for account in accounts:
+            if not account or not account.data:
+                continue
+
+            account_dict = account_dicts.get(type(account))
+
+            if account_dict is not None:
+                account_dict[account.public_key] = account
+            elif isinstance(account, PythMappingAccount):
+                if test_mode or str(account.public_key) in reference_mapping_keys:
+                    self._mapping_accounts[account.public_key] = account
+                    self._mapping_chain = None
+            elif isinstance(account, PythAuthorityPermissionAccount):
+                self.authority_permission_account = account
+
+    def _store_program_accounts(self, response: GetProgramAccountsResp):
+        test_mode = os.environ.get("TEST_MODE")
+        reference_mapping_keys = self._reference_mapping_keys()
+        accounts: List[Optional[PythAccount]] = []
+
+        for record in response.value:
+            size = len(record.account.data)
+
+            # Skip records of other sizes before parsing them, the unfiltered
+            # fallback scan returns every account owned by the program.
+            if size not in PROGRAM_ACCOUNT_SIZES:
+                continue
+
+            # Mapping accounts are only kept for the reference pairs, so don't
+            # parse (and then discard) the others
+            if (
+                size == MAPPING_ACCOUNT_SIZE
+                and not test_mode
+                and str(record.pubkey) not in reference_mapping_keys
+            ):
+                continue
+
+            accounts.append(parse_account(record))
+
+        self._store_accounts(accounts)
+
+    async def _scan_program_accounts(self, size: int):
+        response = await self._read(
+            lambda client: client.get_program_accounts(
+                pubkey=self.program_key,
+                encoding="base64",
+                commitment=READ_COMMITMENT,
+                filters=[size],
+            )
+        )
+
+        # Parse each response as soon as it arrives, while the other scans are
+        # still downloading
+        self._store_program_accounts(response)
 
     async def refresh_program_accounts(self):
-        async with AsyncClient(self.rpc_endpoint) as client:
-            logger.info("Refreshing program accounts")
-            result = (
-                await client.get_program_accounts(
-                    pubkey=self.program_key,
-                    encoding="base64",
-                    commitment=self.commitment,
+        logger.info("Refreshing program accounts")
+
+        # Filter accounts by size server-side (one request per known account
+        # size) so the RPC node does not serialize unrelated program accounts.
+        # The authority permission account is a PDA, so fetch it by key.
+        *scan_results, permissions_result = await asyncio.gather(
+            *[self._scan_program_accounts(size) for size in PROGRAM_ACCOUNT_SIZES],
+            self.refresh_accounts_by_key(
+                [
+                    get_permissions_account(
+                        self.program_key, pyth_program.AUTHORITY_PERMISSIONS_PDA_SEED
+                    )
+                ]
+            ),
+            return_exceptions=True,
+        )
+
+        if isinstance(permissions_result, BaseException):
+            raise permissions_result
+
+        for result in scan_results:
+            if isinstance(result, RPCException):
+                # Some RPC nodes reject filtered scans, so fall back to a full
+                # one (accounts stored by successful scans are stored again)
+                logger.warning(f"Filtered program accounts request failed: {result}")
+                self._store_program_accounts(
+                    await self._read(
+                        lambda client: client.get_program_accounts(
+                            pubkey=self.program_key,
+                            encoding="base64",
+                            commitment=READ_COMMITMENT,
+                        )
+                    )
                 )
-            ).value
+                break
 
-            reference_pairs = {
-                (
-                    "gSbePebfvPy7tRqimPoVecS2UsBvYv46ynrzWocc92s",
-                    "BmA9Z6FjioHJPpjT39QazZyhDRUdZy2ezwx4GiDdE2u2",
-                ),
-                (
-                    "8tfDNiaEyrV6Q1U4DEXrEigs9DoDtkugzFbybENEbCDz",
-                    "AFmdnt9ng1uVxqCmqwQJDAYC5cKTkw8gJKSM5PnzuF6z",
-                ),
-                (
-                    "FsJ3A3u2vn5cTVofAjvy6y5kwABJAqYWpe4975bi2epH",
-                    "AHtgzX45WTKfkPG53L6WYhGEXwQkN1BVknET3sVsLL8J",
-                ),
-            }
+            if isinstance(result, BaseException):
+                raise result
 
-            for record in result:
-                account = parse_account(record)
+        logger.debug(f"Found {len(self._mapping_accounts)} mapping account(s)")
+        logger.debug(f"Found {len(self._product_accounts)} product account(s)")
+        logger.debug(f"Found {len(self._price_accounts)} price account(s)")
 
-                if not account or not account.data:
-                    continue
+        if self.authority_permission_account:
+            permission_account = self.authority_permission_account
+            # Lazy, so the account data is only formatted when debug is enabled
+            logger.opt(lazy=True).debug(
+                "Found permission account: {}", lambda: permission_account.data
+            )
+        else:
+            logger.debug("Authority permission account not found")
 
-                if isinstance(account, PythMappingAccount):
-                    actual_pair = (
-                        os.environ.get("PROGRAM_KEY") or str(self.program_key),
-                        str(account.public_key),
+    async def refresh_accounts_by_key(self, keys: List[PublicKey]):
+        """
+        Refresh only the given accounts using getMultipleAccounts, which is much
+        cheaper than scanning every program account when the keys are known.
+        """
+        logger.info(f"Refreshing {len(keys)} account(s)")
+        chunks = [
+            keys[i : i + MAX_MULTIPLE_ACCOUNTS]
+            for i in range(0, len(keys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        responses = await asyncio.gather(
+            *[
+                self._read(
+                    lambda client, chunk=chunk: client.get_multiple_accounts(
+                        chunk, encoding="base64", commitment=READ_COMMITMENT
                     )
-                    test_mode = os.environ.get("TEST_MODE")
+                )
+                for chunk in chunks
+            ]
+        )
 
-                    if test_mode or actual_pair in reference_pairs:
-                        self._mapping_accounts[account.public_key] = account
+        program_owner = bytes(self.program_key)
+
+        for chunk, response in zip(chunks, responses):
+            # Accounts the program does not own (e.g. closed and reassigned) are
+            # not Pyth accounts, whatever their data looks like
+            owned_accounts = [
+                account if account and bytes(account.owner) == program_owner else None
+                for account in response.value
+            ]
+            self._store_accounts(
+                parse_account_info(key, account)
+                for key, account in zip(chunk, owned_accounts)
+                if account
+            )
+            self._forget_accounts(
+                key for key, account in zip(chunk, owned_accounts) if not account
+            )
 
-                if isinstance(account, PythProductAccount):
-                    self._product_accounts[account.public_key] = account
+    async def refresh_known_accounts(self, extra_keys: Iterable[PublicKey] = ()):
+        """
+        Refresh the accounts loaded by a previous refresh (and extra_keys) using
+        getMultipleAccounts, then follow their references to accounts that were
+        not loaded yet. This avoids a getProgramAccounts scan on repeat syncs.
+        """
+        fetched_keys: Set[PublicKey] = set()
+        keys = {
+            *self._mapping_accounts,
+            *self._product_accounts,
+            *self._price_accounts,
+            *extra_keys,
+            get_permissions_account(
+                self.program_key, pyth_program.AUTHORITY_PERMISSIONS_PDA_SEED
+            ),
+        }
 
-                if isinstance(account, PythPriceAccount):
-                    self._price_accounts[account.public_key] = account
+        while keys:
+            await self.refresh_accounts_by_key(list(keys))
+            fetched_keys.update(keys)
+            keys = self._referenced_account_keys() - fetched_keys
 
-                if isinstance(account, PythAuthorityPermissionAccount):
-                    self.authority_permission_account = account
+    async def refresh_linked_accounts(self, extra_keys: Iterable[PublicKey] = ()):
+        """
+        Refresh the accounts linked from the mapping accounts (and extra_keys).
+        Accounts loaded by a previous refresh, or outside of test mode reachable
+        from the reference mapping accounts, are walked by key. The program is
+        only scanned when no mapping account is known.
+        """
+        reference_mapping_keys = (
+            []
+            if os.environ.get("TEST_MODE")
+            else [PublicKey(key) for key in self._reference_mapping_keys()]
+        )
 
-            logger.debug(f"Found {len(self._mapping_accounts)} mapping account(s)")
-            logger.debug(f"Found {len(self._product_accounts)} product account(s)")
-            logger.debug(f"Found {len(self._price_accounts)} price account(s)")
+        if self._mapping_accounts or reference_mapping_keys:
+            await self.refresh_known_accounts([*reference_mapping_keys, *extra_keys])
+        else:
+            await self.refresh_program_accounts()
 
-            if self.authority_permission_account:
-                logger.debug(
-                    f"Found permission account: {self.authority_permission_account.data}"
-                )
-            else:
-                logger.debug("Authority permission account not found")
+    def _referenced_account_keys(self) -> Set[PublicKey]:
+        keys: Set[PublicKey] = set()
 
-    async def send_transaction(
-        self, instructions: List[TransactionInstruction], signers: List[Keypair]
-    ):
-        if not instructions:
-            return
-
-        async with AsyncClient(self.rpc_endpoint) as client:
-            logger.debug(f"Sending {len(instructions)} instructions")
-
-            blockhash = await recent_blockhash(client)
-            transaction = Transaction(
-                recent_blockhash=blockhash, fee_payer=signers[0].public_key
-            )  # The fee payer is the first signer
-            transaction.add(instructions[0])
-            transaction.sign(*get_actual_signers(signers, transaction))
-
-            ix_index = 1
-
-            # FIXME: Ideally, we would compute the exact additional size of each
-            # instruction, add it to the current transaction size and compare
-            # that with PACKET_DATA_SIZE. But there is currently no method that
-            # returns that information (and no straightforward way to remove an
-            # instruction from a transaction if it becomes too large), so we
-            # stop adding instructions to a transaction once it reaches half of
-            # the maximum size (with the assumption that no single instruction
-            # will add more than PACKET_DATA_SIZE/2 bytes to a transaction).
+        for mapping_account in self._mapping_accounts.values():
+            keys.add(mapping_account.data.next_mapping_account_key)
+            keys.update(mapping_account.data.product_account_keys)
+
+        for product_account in self._product_accounts.values():
+            keys.add(product_account.data.first_price_account_key)
+
+        for price_account in self._price_accounts.values():
+            keys.add(price_account.data.next_price_account_key)
+
+        keys.discard(ZERO_PUBLIC_KEY)
+
+        return keys
+
+    def _forget_accounts(self, keys: Iterable[PublicKey]):
+        """
+        Drop accounts that no longer exist on chain.
+        """
+        for key in keys:
+            self._product_accounts.pop(key, None)
+            self._price_accounts.pop(key, None)
+
+            if self._mapping_accounts.pop(key, None):
+                self._mapping_chain = None
+
+    def _partition_instructions(
+        self, instructions: List[TransactionInstruction], fee_payer: PublicKey
+    ) -> List[List[TransactionInstruction]]:
+        """
+        Split instructions, in order, into groups that each fit in a transaction
+        paid by fee_payer under the packet size threshold.
+        """
+        groups: List[List[TransactionInstruction]] = []
+        instruction_count = len(instructions)
+        ix_index = 0
+
+        while ix_index < instruction_count:
+            # Account for each instruction by its marginal size instead of
+            # serializing the transaction, which would require signing it
+            # after every addition. The transaction is only built and signed
+            # once its instructions are chosen.
+            first_index = ix_index
+            transaction_size = EMPTY_TRANSACTION_SIZE
+            account_keys = {fee_payer}
+            signer_keys = {fee_payer}
+
+            # The running size is exact, so instructions are added for as long
+            # as the transaction still fits in a single packet.
             #
-            # FIXME: Also, we probably want to give control of the instructions
+            # FIXME: We probably want to give control of the instructions
             # that go in a transaction to the caller. That way, we can ensure
             # that mapping/product/price accounts are always created and
             # initialized atomically.
-            while (
-                compute_transaction_size(transaction) < (PACKET_DATA_SIZE / 2)
-                and instructions[ix_index:]
-            ):
-                transaction.add(instructions[ix_index])
-                transaction.sign(*get_actual_signers(signers, transaction))
+            while ix_index < instruction_count:
+                instruction = instructions[ix_index]
+                instruction_size = compute_instruction_size(
+                    instruction,
+                    account_keys,
+                    signer_keys,
+                    ix_index - first_index,
+                )
+
+                if (
+                    ix_index > first_index
+                    and transaction_size + instruction_size > PACKET_DATA_SIZE
+                ):
+                    break
+
+                transaction_size += instruction_size
+                account_keys.add(instruction.program_id)
+                account_keys.update(account.pubkey for account in instruction.keys)
+                signer_keys.update(
+                    account.pubkey for account in instruction.keys if account.is_signer
+                )
                 ix_index += 1
 
-            response = await client.send_raw_transaction(
-                transaction.serialize(),
-                opts=TxOpts(
-                    skip_confirmation=False, preflight_commitment=self.commitment
-                ),
+            groups.append(instructions[first_index:ix_index])
+
+        return groups
+
+    def _build_transaction(
+        self,
+        instructions: List[TransactionInstruction],
+        signers: List[Keypair],
+        blockhash: Blockhash,
+    ) -> Transaction:
+        """
+        Build a transaction paid by the first signer, signed only by the
+        signers its instructions require.
+        """
+        fee_payer = signers[0].public_key
+        signer_keys = {fee_payer}
+        signer_keys.update(
+            account.pubkey
+            for instruction in instructions
+            for account in instruction.keys
+            if account.is_signer
+        )
+
+        transaction = Transaction(recent_blockhash=blockhash, fee_payer=fee_payer)
+        transaction.add(*instructions)
+        transaction.sign(
+            *[signer for signer in signers if signer.public_key in signer_keys]
+        )
+
+        return transaction
+
+    async def _batch_request(
+        self, method: str, params: List[List[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send a single JSON-RPC batch request calling method once per params
+        entry, and return the responses in the same order.
+        """
+        client = await self._get_client()
+        # The client has no public API for batch requests, so post the batch
+        # through its HTTP session to reuse the open connection.
+        provider = client._provider  # pylint: disable=protected-access
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": p}
+            for request_id, p in enumerate(params)
+        ]
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            response = await self._rpc(
+                provider.session.post(provider.endpoint_uri, json=payload)
             )
-            logger.debug(f"Transaction: {response.value}")
-            logger.debug(f"Sent {ix_index} instructions")
 
-            remaining_instructions = instructions[ix_index:]
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
 
-            if remaining_instructions:
-                logger.debug("Sending remaining instructions in separate transaction")
-                await self.send_transaction(remaining_instructions, signers)
+            # Rate limited, back off (with jitter so that concurrent batches
+            # don't retry in lockstep) outside of the RPC semaphore. Resending
+            # a signed transaction is safe, it is deduplicated by signature.
+            delay = RATE_LIMIT_RETRY_DELAY * 2**attempt
+            logger.warning(f"RPC rate limited, retrying {method} in {delay:.1f}s")
+            await asyncio.sleep(delay * (1 + random.random()))
 
-    async def sync(
-        self,
-        ref_products: Dict[str, ReferenceProduct],
-        ref_publishers: ReferencePublishers,
-        ref_permissions: ReferencePermissions,
-        ref_authority_permissions: ReferenceAuthorityPermissions,
-        send_transactions: bool = True,
-        generate_keys: bool = False,
-        allocate_price_v2: bool = True,
-    ) -> List[TransactionInstruction]:
-        instructions: List[TransactionInstruction] = []
+        response.raise_for_status()
 
-        # Fetch program accounts from the network
-        await self.refresh_program_accounts()
+        # Batch responses are not guaranteed to preserve the request order
+        responses = {item["id"]: item for item in response.json()}
 
-        # Sync authority permissions
-        (
-            authority_instructions,
-            authority_signers,
-        ) = await self.sync_authority_permissions_instructions(
-            ref_authority_permissions
+        return [responses[request_id] for request_id in range(len(params))]
+
+    async def _confirm_signatures(self, signatures: List[str]):
+        """
+        Poll the status of transaction signatures until all of them reach the
+        admin commitment level.
+        """
+        target_level = COMMITMENT_LEVELS.index(self.commitment)
+        deadline = asyncio.get_running_loop().time() + CONFIRMATION_TIMEOUT
+        pending = signatures
+
+        while pending:
+            chunks = [
+                pending[i : i + MAX_SIGNATURE_STATUSES]
+                for i in range(0, len(pending), MAX_SIGNATURE_STATUSES)
+            ]
+            responses = await self._batch_request(
+                "getSignatureStatuses", [[chunk] for chunk in chunks]
+            )
+            still_pending = []
+
+            for chunk, response in zip(chunks, responses):
+                if "error" in response:
+                    raise RuntimeError(
+                        f"Failed to get signature statuses: {response['error']}"
+                    )
+
+                for signature, status in zip(chunk, response["result"]["value"]):
+                    if status and status["err"]:
+                        raise RuntimeError(
+                            f"Transaction {signature} failed: {status['err']}"
+                        )
+
+                    if (
+                        not status
+                        or not status["confirmationStatus"]
+                        or COMMITMENT_LEVELS.index(status["confirmationStatus"])
+                        < target_level
+                    ):
+                        still_pending.append(signature)
+
+            pending = still_pending
+
+            if pending:
+                if asyncio.get_running_loop().time() > deadline:
+                    raise RuntimeError(
+                        f"Timed out confirming {len(pending)} transaction(s)"
+                    )
+
+                await asyncio.sleep(CONFIRMATION_POLL_INTERVAL)
+
+    async def _send_transactions(
+        self, transactions: List[Transaction]
+    ) -> List[Optional[Any]]:
+        """
+        Submit transactions concurrently and wait for the accepted ones to be
+        confirmed. Returns the submission error of each transaction (or None).
+        """
+        chunks = [
+            transactions[i : i + MAX_CONCURRENT_TRANSACTIONS]
+            for i in range(0, len(transactions), MAX_CONCURRENT_TRANSACTIONS)
+        ]
+        chunk_responses = await asyncio.gather(
+            *[
+                self._batch_request(
+                    "sendTransaction",
+                    [
+                        [
+                            base64.b64encode(transaction.serialize()).decode(),
+                            {
+                                "encoding": "base64",
+                                "preflightCommitment": self.commitment,
+                            },
+                        ]
+                        for transaction in chunk
+                    ],
+                )
+                for chunk in chunks
+            ]
         )
 
-        if authority_instructions:
-            instructions.extend(authority_instructions)
+        signatures: List[str] = []
+        errors: List[Optional[Any]] = []
+
+        for responses in chunk_responses:
+            for response in responses:
+                if "error" in response:
+                    errors.append(response["error"])
+                else:
+                    logger.debug(f"Transaction: {response['result']}")
+                    signatures.append(response["result"])
+                    errors.append(None)
+
+        # Wait for the accepted transactions even if some were rejected, so
+        # that callers see a consistent state when handling the error.
+        if signatures:
+            await self._confirm_signatures(signatures)
 
-            if send_transactions:
-                await self.send_transaction(authority_instructions, authority_signers)
+        return errors
 
-        # Sync mapping accounts
-        mapping_instructions, mapping_keypairs = await self.sync_mapping_instructions(
-            generate_keys
+    async def send_transactions_batch(
+        self, batches: List[Tuple[List[TransactionInstruction], List[Keypair]]]
+    ):
+        """
+        Send several (instructions, signers) pairs with as few JSON-RPC batch
+        requests as possible, and wait for all of them to be confirmed.
+        """
+        pending = [
+            (
+                self._partition_instructions(instructions, signers[0].public_key),
+                signers,
+            )
+            for instructions, signers in batches
+            if instructions
+        ]
+
+        logger.opt(lazy=True).debug(
+            "Sending {} instructions in {} transaction(s)",
+            lambda: sum(len(batch[0]) for batch in batches),
+            lambda: sum(len(groups) for groups, _ in pending),
         )
 
-        if mapping_instructions:
-            instructions.extend(mapping_instructions)
-            if send_transactions:
-                await self.send_transaction(mapping_instructions, mapping_keypairs)
+        # The transactions split from one instruction list may depend on each
+        # other (e.g. an account is created before it is initialized), so they
+        # are sent one at a time, each confirmed before the next. Separate
+        # instruction lists are independent, and their transactions are sent
+        # together.
+        errors: List[Any] = []
+
+        if pending:
+            self._has_written = True
+
+        while pending:
+            blockhash = await self._get_recent_blockhash()
+            transaction_errors = await self._send_transactions(
+                [
+                    self._build_transaction(groups[0], signers, blockhash)
+                    for groups, signers in pending
+                ]
+            )
+            still_pending = []
 
-            await self.refresh_program_accounts()
+            for (groups, signers), error in zip(pending, transaction_errors):
+                # The rest of an instruction list depends on a failed
+                # transaction, so it is not sent
+                if error is not None:
+                    errors.append(error)
+                elif len(groups) > 1:
+                    still_pending.append((groups[1:], signers))
 
-        # FIXME: We should check if the mapping account has enough space to
-        # add/remove new products. That is not urgent because we are around 10%
-        # of the first mapping account capacity.
+            pending = still_pending
 
-        # Sync product/price accounts
+        if errors:
+            raise RuntimeError(f"Failed to send {len(errors)} transaction(s): {errors}")
 
-        product_transactions: List[asyncio.Task[None]] = []
+    async def send_transaction(
+        self, instructions: List[TransactionInstruction], signers: List[Keypair]
+    ):
+        await self.send_transactions_batch([(instructions, signers)])
 
-        product_updates: bool = False
+    async def sync(
+        self,
+        ref_products: Dict[str, ReferenceProduct],
+        ref_publishers: ReferencePublishers,
+        ref_permissions: ReferencePermissions,
+        ref_authority_permissions: ReferenceAuthorityPermissions,
+        send_transactions: bool = True,
+        generate_keys: bool = False,
+        allocate_price_v2: bool = True,
+    ) -> List[TransactionInstruction]:
+        try:
+            instructions: List[TransactionInstruction] = []
+
+            # Load (or generate) every product/price keypair and resolve the
+            # publisher keys permitted on each price account up front, so that
+            # missing keys or publishers are reported before any transaction is
+            # sent.
+            # Keypair files are read in worker threads, so that disk reads overlap.
+            symbol_keypairs: Dict[str, Tuple[Keypair, Keypair]] = {}
+            permitted_publishers: Dict[str, FrozenSet[PublicKey]] = {}
+            loaded_keypairs = await asyncio.gather(
+                *[
+                    asyncio.to_thread(
+                        self._load_symbol_keypairs, jump_symbol, generate_keys
+                    )
+                    for jump_symbol in ref_permissions
+                ]
+            )
+
+            for (jump_symbol, permissions), keypairs in zip(
+                ref_permissions.items(), loaded_keypairs
+            ):
+                symbol_keypairs[jump_symbol] = keypairs
+                permitted_publishers[jump_symbol] = frozenset(
+                    ref_publishers["keys"][name] for name in permissions["price"]
+                )
 
-        for jump_symbol, _price_account_map in ref_permissions.items():
-            ref_product = ref_products[jump_symbol]  # type: ignore
+            # Fetch program accounts from the network, warming the rent cache
+            # for new accounts in the same round trip.
+            await asyncio.gather(
+                self.refresh_linked_accounts(
+                    keypair.public_key
+                    for keypairs in symbol_keypairs.values()
+                    for keypair in keypairs
+                ),
+                self._prefetch_rent(),
+            )
 
-            logger.debug(f"Syncing product: {jump_symbol}")
+            # Sync authority permissions
             (
-                product_instructions,
-                product_keypairs,
-            ) = await self.sync_product_instructions(
-                ref_product, generate_keys, allocate_price_v2
+                authority_instructions,
+                authority_signers,
+            ) = await self.sync_authority_permissions_instructions(
+                ref_authority_permissions
             )
 
-            if product_instructions:
-                product_updates = True
+            if authority_instructions:
+                instructions.extend(authority_instructions)
 
-                instructions.extend(product_instructions)
                 if send_transactions:
-                    product_transactions.append(
-                        asyncio.create_task(
-                            self.send_transaction(
-                                product_instructions, product_keypairs
+                    await self.send_transaction(
+                        authority_instructions, authority_signers
+                    )
+
+            # Sync mapping accounts
+            (
+                mapping_instructions,
+                mapping_keypairs,
+            ) = await self.sync_mapping_instructions(generate_keys)
+
+            if mapping_instructions:
+                instructions.extend(mapping_instructions)
+                # Nothing changed on chain in a dry run, so there is nothing to
+                # record either.
+                if send_transactions:
+                    await self.send_transaction(mapping_instructions, mapping_keypairs)
+                    # The only mapping change is the initialization of an empty
+                    # first mapping account, so record it instead of fetching it
+                    self._store_accounts(
+                        [
+                            PythMappingAccount(
+                                public_key=mapping_keypairs[1].public_key,
+                                owner=self.program_key,
+                                lamports=await self.fetch_minimum_balance(
+                                    MAPPING_ACCOUNT_SIZE
+                                ),
+                                data=MappingData(
+                                    used_size=MAPPING_FIELDS.size,
+                                    product_count=0,
+                                    next_mapping_account_key=ZERO_PUBLIC_KEY,
+                                    product_account_keys=[],
+                                ),
                             )
-                        )
+                        ]
                     )
 
-                    if len(product_transactions) == MAX_CONCURRENT_TRANSACTIONS:
-                        await asyncio.gather(*product_transactions)
-                        product_transactions = []
+            # FIXME: We should check if the mapping account has enough space to
+            # add/remove new products. That is not urgent because we are around 10%
+            # of the first mapping account capacity.
+
+            # Sync product/price accounts. Publisher permissions only depend on
+            # the price account, so they are synced concurrently for symbols
+            # whose price account already exists, and after product creation
+            # for the remaining symbols. The publisher (price store) program
+            # is independent of the oracle accounts, so it is synced alongside.
+            existing_symbols: List[str] = []
+            new_symbols: List[str] = []
+
+            for jump_symbol, (_, price_keypair) in symbol_keypairs.items():
+                if price_keypair.public_key in self._price_accounts:
+                    existing_symbols.append(jump_symbol)
+                else:
+                    new_symbols.append(jump_symbol)
+
+            results = await asyncio.gather(
+                self._sync_products(
+                    ref_products,
+                    symbol_keypairs,
+                    send_transactions,
+                    allocate_price_v2,
+                ),
+                self._sync_publishers(
+                    ref_products,
+                    ref_publishers,
+                    permitted_publishers,
+                    symbol_keypairs,
+                    existing_symbols,
+                    send_transactions,
+                ),
+                self._sync_price_store(ref_publishers, send_transactions),
+                return_exceptions=True,
+            )
 
-        if product_transactions:
-            await asyncio.gather(*product_transactions)
+            # All passes are awaited before raising so that none keeps running
+            # against a closed client.
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
-        if product_updates:
-            await self.refresh_program_accounts()
+            (
+                product_instructions,
+                existing_price_instructions,
+                price_store_instructions,
+            ) = results
+
+            # Sync publishers of newly created price accounts
+            new_price_instructions = await self._sync_publishers(
+                ref_products,
+                ref_publishers,
+                permitted_publishers,
+                symbol_keypairs,
+                new_symbols,
+                send_transactions,
+            )
 
-        # Sync publisher program
+            # Return the instructions in stage order, whatever ran concurrently:
+            # products, the price store, then publishers in reference order.
+            price_instructions = {
+                **dict(zip(existing_symbols, existing_price_instructions)),
+                **dict(zip(new_symbols, new_price_instructions)),
+            }
+            instructions.extend(product_instructions)
+            instructions.extend(price_store_instructions)
+
+            for jump_symbol in symbol_keypairs:
+                instructions.extend(price_instructions[jump_symbol])
+
+            return instructions
+        finally:
+            await self.close()
+
+    async def _sync_price_store(
+        self, ref_publishers: ReferencePublishers, send_transactions: bool
+    ) -> List[TransactionInstruction]:
         (
             price_store_instructions,
             price_store_signers,
         ) = await self.sync_price_store(ref_publishers)
 
         logger.debug(
-            f"Syncing price store program - {len(price_store_instructions)} instructions"
+            "Syncing price store program - "
+            f"{len(price_store_instructions)} instructions"
         )
 
-        if price_store_instructions:
-            instructions.extend(price_store_instructions)
-            if send_transactions:
-                await self.send_transaction(
-                    price_store_instructions, price_store_signers
-                )
+        if price_store_instructions and send_transactions:
+            await self.send_transaction(price_store_instructions, price_store_signers)
 
-        # Sync publishers
+        return price_store_instructions
 
-        publisher_transactions = []
+    async def _build_and_send(
+        self,
+        builders: Iterable[
+            Awaitable[Tuple[List[TransactionInstruction], List[Keypair]]]
+        ],
+        send_transactions: bool,
+    ) -> List[Tuple[List[TransactionInstruction], List[Keypair]]]:
+        """
+        Await instruction builders (at most MAX_CONCURRENT_SYNCS at a time) and
+        send all of their results together. Results keep the builders order.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYNCS)
 
-        for jump_symbol, _price_account_map in ref_permissions.items():
-            ref_product = ref_products[jump_symbol]  # type: ignore
+        async def build(
+            builder: Awaitable[Tuple[List[TransactionInstruction], List[Keypair]]]
+        ) -> Tuple[List[TransactionInstruction], List[Keypair]]:
+            async with semaphore:
+                return await builder
 
-            logger.debug(f"Syncing price: {jump_symbol}")
-            (price_instructions, price_keypairs,) = await self.sync_price_instructions(
-                ref_product,
-                ref_publishers,
-                ref_permissions,
-            )
+        results = await asyncio.gather(*[build(builder) for builder in builders])
 
-            if price_instructions:
-                instructions.extend(price_instructions)
-                if send_transactions:
-                    publisher_transactions.append(
-                        asyncio.create_task(
-                            self.send_transaction(price_instructions, price_keypairs)
-                        )
-                    )
+        if send_transactions:
+            await self.send_transactions_batch(results)
+
+        return results
 
-                    if len(publisher_transactions) == MAX_CONCURRENT_TRANSACTIONS:
-                        await asyncio.gather(*publisher_transactions)
-                        publisher_transactions = []
+    async def _sync_products(
+        self,
+        ref_products: Dict[str, ReferenceProduct],
+        symbol_keypairs: Dict[str, Tuple[Keypair, Keypair]],
+        send_transactions: bool,
+        allocate_price_v2: bool,
+    ) -> List[TransactionInstruction]:
+        instructions: List[TransactionInstruction] = []
+
+        # Mapping, product and price accounts touched by product updates
+        updated_keys: Set[PublicKey] = set()
+
+        if not symbol_keypairs:
+            return instructions
+
+        # New products are added to the last mapping account of the chain
+        mapping_keypair = self._load_keypair(self.get_mapping_chain()[-1])
+
+        # Product and price accounts missing from the program may still have
+        # been created by an interrupted sync, check all of them at once.
+        existing_account_keys = await self._existing_account_keys(
+            [
+                keypair.public_key
+                for keypairs in symbol_keypairs.values()
+                for keypair in keypairs
+                if keypair.public_key not in self._product_accounts
+                and keypair.public_key not in self._price_accounts
+            ]
+        )
 
-        if publisher_transactions:
-            await asyncio.gather(*publisher_transactions)
+        logger.debug(f"Syncing {len(symbol_keypairs)} product(s)")
+        product_results = await self._build_and_send(
+            [
+                self.sync_product_instructions(
+                    ref_products[jump_symbol],
+                    mapping_keypair,
+                    *keypairs,
+                    allocate_price_v2,
+                    existing_account_keys,
+                )
+                for jump_symbol, keypairs in symbol_keypairs.items()
+            ],
+            send_transactions,
+        )
+
+        for product_instructions, product_keypairs in product_results:
+            if product_instructions:
+                # Skip the funding keypair, which is always listed first
+                updated_keys.update(
+                    keypair.public_key for keypair in product_keypairs[1:]
+                )
+                instructions.extend(product_instructions)
+
+        if send_transactions and updated_keys:
+            await self.refresh_accounts_by_key(list(updated_keys))
 
         return instructions
 
+    async def _sync_publishers(
+        self,
+        ref_products: Dict[str, ReferenceProduct],
+        ref_publishers: ReferencePublishers,
+        permitted_publishers: Dict[str, FrozenSet[PublicKey]],
+        symbol_keypairs: Dict[str, Tuple[Keypair, Keypair]],
+        jump_symbols: List[str],
+        send_transactions: bool,
+    ) -> List[List[TransactionInstruction]]:
+        """
+        Sync the publishers of the given symbols. Returns the instructions of
+        each symbol, in the order of jump_symbols.
+        """
+        logger.debug(f"Syncing {len(jump_symbols)} price(s)")
+        price_results = await self._build_and_send(
+            [
+                self.sync_price_instructions(
+                    ref_products[jump_symbol],
+                    symbol_keypairs[jump_symbol][1],
+                    ref_publishers,
+                    permitted_publishers[jump_symbol],
+                )
+                for jump_symbol in jump_symbols
+            ],
+            send_transactions,
+        )
+
+        return [price_instructions for price_instructions, _ in price_results]
+
     async def sync_mapping_instructions(
         self,
         generate_keys: bool,
     ) -> Tuple[List[TransactionInstruction], List[Keypair]]:
-        mapping_chain = sort_mapping_account_keys(list(self._mapping_accounts.values()))
-        funding_keypair = load_keypair("funding", key_dir=self.key_dir)
-        mapping_0_keypair = load_keypair(
-            "mapping_0", key_dir=self.key_dir, generate=generate_keys
-        )
+        mapping_chain = self.get_mapping_chain()
+        funding_keypair = self._load_keypair("funding")
+        mapping_0_keypair = self._load_keypair("mapping_0", generate=generate_keys)
         instructions: List[TransactionInstruction] = []
 
         if not mapping_chain:
             logger.info("Creating new mapping account")
 
-            if not (
-                await account_exists(self.rpc_endpoint, mapping_0_keypair.public_key)
-            ):
+            if not (await self._account_exists(mapping_0_keypair.public_key)):
                 logger.debug("Building system.program.create_account instruction")
                 instructions.append(
                     system_program.create_account(
@@ -409,32 +1298,36 @@ class ProgramAdmin:
     async def sync_product_instructions(
         self,
         product: ReferenceProduct,
-        generate_keys: bool,
+        mapping_keypair: Keypair,
+        product_keypair: Keypair,
+        price_keypair: Keypair,
         allocate_price_v2: bool,
+        existing_account_keys: Optional[Set[PublicKey]] = None,
     ) -> Tuple[List[TransactionInstruction], List[Keypair]]:
         instructions: List[TransactionInstruction] = []
-        funding_keypair = load_keypair("funding", key_dir=self.key_dir)
-        mapping_chain = sort_mapping_account_keys(list(self._mapping_accounts.values()))
-        mapping_keypair = load_keypair(mapping_chain[-1], key_dir=self.key_dir)
-        product_keypair = load_keypair(
-            f"product_{product['jump_symbol']}",
-            key_dir=self.key_dir,
-            generate=generate_keys,
-        )
+        funding_keypair = self._load_keypair("funding")
         product_account = self._product_accounts.get(product_keypair.public_key)
-        price_keypair = load_keypair(
-            f"price_{product['jump_symbol']}",
-            key_dir=self.key_dir,
-            generate=generate_keys,
-        )
         price_account = self._price_accounts.get(price_keypair.public_key)
 
+        # Accounts missing from the program may still have been created by an
+        # interrupted sync, check both of them at once (unless the caller
+        # already checked them).
+        if existing_account_keys is None:
+            existing_account_keys = await self._existing_account_keys(
+                [
+                    keypair.public_key
+                    for keypair, account in [
+                        (product_keypair, product_account),
+                        (price_keypair, price_account),
+                    ]
+                    if not account
+                ]
+            )
+
         if not product_account:
             logger.info(f"Creating new product account for {product['jump_symbol']}")
 
-            if not (
-                await account_exists(self.rpc_endpoint, product_keypair.public_key)
-            ):
+            if product_keypair.public_key not in existing_account_keys:
                 logger.debug("Building system_program.create_account instruction")
                 instructions.append(
                     system_program.create_account(
@@ -472,7 +1365,7 @@ class ProgramAdmin:
         if not price_account:
             logger.info(f"Creating new price account for {product['jump_symbol']}")
 
-            if not await account_exists(self.rpc_endpoint, price_keypair.public_key):
+            if price_keypair.public_key not in existing_account_keys:
                 price_alloc_size = (
                     PRICE_ACCOUNT_V2_SIZE
                     if allocate_price_v2
@@ -508,12 +1401,10 @@ class ProgramAdmin:
 
         # When product/price account exists, we check if metadata is up to date
         if product_account and price_account:
-            same_product_metadata = True
-
-            for key, value in product["metadata"].items():
-                if product_account.data.metadata.get(key) != value:
-                    same_product_metadata = False
-                    break
+            # Metadata values are strings, so the items views are set-like
+            same_product_metadata = (
+                product["metadata"].items() <= product_account.data.metadata.items()
+            )
 
             if not same_product_metadata:
                 logger.info(
@@ -537,19 +1428,29 @@ class ProgramAdmin:
     async def sync_price_instructions(
         self,
         reference_product: ReferenceProduct,
+        price_keypair: Keypair,
         reference_publishers: ReferencePublishers,
-        reference_permissions: ReferencePermissions,
+        new_publisher_keys: FrozenSet[PublicKey],
     ) -> Tuple[List[TransactionInstruction], List[Keypair]]:
-        instructions: List[TransactionInstruction] = []
-        funding_keypair = load_keypair("funding", key_dir=self.key_dir)
-        price_keypair = load_keypair(
-            f"price_{reference_product['jump_symbol']}", key_dir=self.key_dir
-        )
         price_account = self.get_price_account(price_keypair.public_key)
+        expected_min_publishers = reference_product["min_publishers"]
+        current_publisher_keys = {
+            comp.publisher_key for comp in price_account.data.price_components
+        }
+
+        # Most price accounts are already in sync, skip them before doing any
+        # other work
+        if current_publisher_keys == new_publisher_keys and (
+            expected_min_publishers is None
+            or price_account.data.min_publishers == expected_min_publishers
+        ):
+            return ([], [])
+
+        instructions: List[TransactionInstruction] = []
+        funding_keypair = self._load_keypair("funding")
 
         # Sync min publishers (if specified)
-        if reference_product["min_publishers"] is not None:
-            expected_min_publishers = reference_product["min_publishers"]
+        if expected_min_publishers is not None:
             if price_account.data.min_publishers != expected_min_publishers:
                 instructions.append(
                     pyth_program.set_minimum_publishers(
@@ -561,15 +1462,7 @@ class ProgramAdmin:
                 )
 
         # Synchronize publisher permissions
-        current_publisher_keys = {
-            comp.publisher_key for comp in price_account.data.price_components
-        }
-        new_publisher_names = set(
-            reference_permissions[reference_product["jump_symbol"]]["price"]
-        )
-        new_publisher_keys = {
-            reference_publishers["keys"][name] for name in new_publisher_names
-        }
+        publisher_names = reference_publishers["names"]
         publishers_to_add = new_publisher_keys - current_publisher_keys
         publishers_to_remove = current_publisher_keys - new_publisher_keys
 
@@ -588,7 +1481,7 @@ class ProgramAdmin:
 
         for publisher_key in publishers_to_add:
             logger.info(
-                f"Adding publisher key: {publisher_key} ({reference_publishers['names'][publisher_key]})"
+                f"Adding publisher key: {publisher_key} ({publisher_names[publisher_key]})"
             )
             logger.debug("Building pyth_program.add_publisher instruction")
             instructions.append(
@@ -615,9 +1508,7 @@ class ProgramAdmin:
                 reference_authority_permissions
             )
         ):
-            upgrade_authority_keypair = load_keypair(
-                "upgrade_authority", key_dir=self.key_dir
-            )
+            upgrade_authority_keypair = self._load_keypair("upgrade_authority")
 
             logger.debug("Building pyth_program.upd_permissions instruction")
             instruction = pyth_program.upd_permissions(
@@ -637,15 +1528,10 @@ class ProgramAdmin:
         security_authority_path: Path,
         send_transactions: bool,
     ):
-
-        security_authority: Optional[Keypair] = None
-        with open(security_authority_path, encoding="utf8") as file:
-            data = bytes(json.load(file))
-
-            security_authority = Keypair.from_secret_key(data)
-
-        if not security_authority:
-            raise RuntimeError("Could not load security authority keypair")
+        # Read the keypair file in a worker thread to keep the loop responsive
+        security_authority = await asyncio.to_thread(
+            read_keypair, Path(security_authority_path)
+        )
 
         await self.refresh_program_accounts()
 
@@ -674,16 +1560,15 @@ class ProgramAdmin:
         if len(odd_size_prices) > 0:
             logger.info(f"Found {len(odd_size_prices)} unrecognized price accounts")
 
-        instructions = []
         signers = [security_authority]
 
-        for (pubkey, account) in v1_prices.items():
-            logger.debug("Building pyth_program.resize_price_account instruction")
-
-            instruction = pyth_program.resize_price_account_v2(
+        logger.debug(f"Building {len(v1_prices)} resize_price_account instruction(s)")
+        instructions = [
+            pyth_program.resize_price_account_v2(
                 self.program_key, security_authority.public_key, pubkey
             )
-            instructions.append(instruction)
+            for pubkey in v1_prices
+        ]
 
         if send_transactions:
             await self.send_transaction(instructions, signers)
@@ -696,12 +1581,12 @@ class ProgramAdmin:
 
         instructions = []
 
-        authority = load_keypair("funding", key_dir=self.key_dir)
+        authority = self._load_keypair("funding")
 
         price_store_config = price_store_config_account_pubkey(self.price_store_key)
 
         # Initialize the price store program config if it does not exist
-        if not (await account_exists(self.rpc_endpoint, price_store_config)):
+        if not (await self._account_exists(price_store_config)):
             initialize_price_store_instruction = initialize_price_store(
                 self.price_store_key, authority.public_key
             )
@@ -713,7 +1598,7 @@ class ProgramAdmin:
                 publisher, self.price_store_key
             )
 
-            if not (await account_exists(self.rpc_endpoint, publisher_config_account)):
+            if not (await self._account_exists(publisher_config_account)):
                 size = 100048  # This size is for a buffer supporting 5000 price updates
                 lamports = await self.fetch_minimum_balance(size)
                 buffer_account, create_buffer_instruction = create_buffer_account(
@@ -724,7 +1609,7 @@ class ProgramAdmin:
                     lamports,
                 )
 
-                if not (await account_exists(self.rpc_endpoint, buffer_account)):
+                if not (await self._account_exists(buffer_account)):
                     instructions.append(create_buffer_instruction)
 
                 initialize_publisher_config_instruction = initialize_publisher_config(
@@ -3,13 +3,15 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 import click
 from loguru import logger
+from solana.keypair import Keypair
 from solana.publickey import PublicKey
+from solana.transaction import TransactionInstruction
 
-from program_admin import ProgramAdmin, instructions
+from program_admin import MAX_CONCURRENT_RPC_REQUESTS, ProgramAdmin, instructions
 from program_admin.keys import load_keypair, restore_symlink
 from program_admin.parsing import (
     parse_authority_permissions_json,
@@ -18,6 +20,9 @@ from program_admin.parsing import (
     parse_publishers_json,
 )
 from program_admin.program_authority_escrow.instructions import propose
+from program_admin.util import ZERO_PUBLIC_KEY
+
+T = TypeVar("T")
 
 
 @click.group()
@@ -25,6 +30,47 @@ def cli():
     pass
 
 
+def run_with_admin(program_admin: ProgramAdmin, coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a ProgramAdmin coroutine, closing its RPC client once it is done
+    """
+
+    async def run() -> T:
+        async with program_admin:
+            return await coroutine
+
+    return asyncio.run(run())
+
+
+def write_instruction_output(
+    program: PublicKey, instruction: TransactionInstruction, outfile: Optional[str]
+):
+    """
+    Write an instruction as JSON to stdout and, if given, to outfile
+    """
+    instruction_output = json.dumps(
+        [
+            {
+                "program_id": str(program),
+                "data": instruction.data.hex(),
+                "accounts": [
+                    {
+                        "pubkey": str(account.pubkey),
+                        "is_signer": account.is_signer,
+                        "is_writable": account.is_writable,
+                    }
+                    for account in instruction.keys
+                ],
+            }
+        ]
+    )
+
+    sys.stdout.write(instruction_output)
+    if outfile:
+        with open(outfile, "w", encoding="utf-8") as output_file:
+            output_file.write(instruction_output)
+
+
 @click.command()
 @click.option("--network", help="Solana network", envvar="NETWORK")
 @click.option("--rpc-endpoint", help="Solana RPC endpoint", envvar="RPC_ENDPOINT")
@@ -69,10 +115,11 @@ def delete_price(network, rpc_endpoint, program_key, keys, commitment, product,
         price_keypair.public_key,
     )
 
-    asyncio.run(
+    run_with_admin(
+        program_admin,
         program_admin.send_transaction(
             [instruction], [funding_keypair, product_keypair, price_keypair]
-        )
+        ),
     )
 
 
@@ -93,27 +140,7 @@ def set_minimum_publishers(funding_key, program_key, price_key, value, outfile):
     price = PublicKey(price_key)
     instruction = instructions.set_minimum_publishers(program, funding, price, value)
 
-    instruction_output = json.dumps(
-        [
-            {
-                "program_id": str(program),
-                "data": instruction.data.hex(),
-                "accounts": [
-                    {
-                        "pubkey": str(account.pubkey),
-                        "is_signer": account.is_signer,
-                        "is_writable": account.is_writable,
-                    }
-                    for account in instruction.keys
-                ],
-            }
-        ]
-    )
-
-    sys.stdout.write(instruction_output)
-    if outfile:
-        with open(outfile, "w", encoding="utf-8") as output_file:
-            output_file.write(instruction_output)
+    write_instruction_output(program, instruction, outfile)
 
 
 @click.command()
@@ -135,27 +162,7 @@ def update_product_metadata(funding_key, program_key, product_key, metadata, out
         program, funding, product, json.loads(metadata)
     )
 
-    instruction_output = json.dumps(
-        [
-            {
-                "program_id": str(program),
-                "data": instruction.data.hex(),
-                "accounts": [
-                    {
-                        "pubkey": str(account.pubkey),
-                        "is_signer": account.is_signer,
-                        "is_writable": account.is_writable,
-                    }
-                    for account in instruction.keys
-                ],
-            }
-        ]
-    )
-
-    sys.stdout.write(instruction_output)
-    if outfile:
-        with open(outfile, "w", encoding="utf-8") as output_file:
-            output_file.write(instruction_output)
+    write_instruction_output(program, instruction, outfile)
 
 
 @click.command()
@@ -181,27 +188,7 @@ def toggle_publisher(
         program, funding, price, publisher, status
     )
 
-    instruction_output = json.dumps(
-        [
-            {
-                "program_id": str(program),
-                "data": instruction.data.hex(),
-                "accounts": [
-                    {
-                        "pubkey": str(account.pubkey),
-                        "is_signer": account.is_signer,
-                        "is_writable": account.is_writable,
-                    }
-                    for account in instruction.keys
-                ],
-            }
-        ]
-    )
-
-    sys.stdout.write(instruction_output)
-    if outfile:
-        with open(outfile, "w", encoding="utf-8") as output_file:
-            output_file.write(instruction_output)
+    write_instruction_output(program, instruction, outfile)
 
 
 @click.command()
@@ -250,16 +237,23 @@ def delete_product(
         product_keypair.public_key,
     )
 
-    asyncio.run(
+    run_with_admin(
+        program_admin,
         program_admin.send_transaction(
             [instruction], [funding_keypair, mapping_keypair, product_keypair]
-        )
+        ),
     )
 
 
 @click.command()
 @click.option("--network", help="Solana network", envvar="NETWORK")
 @click.option("--rpc-endpoint", help="Solana RPC endpoint", envvar="RPC_ENDPOINT")
+@click.option(
+    "--read-rpc-endpoint",
+    help="Secondary Solana RPC endpoint that account reads are also sent to",
+    envvar="READ_RPC_ENDPOINT",
+    default="",
+)
 @click.option("--program-key", help="Pyth program key", envvar="PROGRAM_KEY")
 @click.option("--keys", help="Path to keys directory", envvar="KEYS")
 @click.option(
@@ -271,17 +265,20 @@ def delete_product(
     envvar="COMMITMENT",
     default="finalized",
 )
-def list_accounts(network, rpc_endpoint, program_key, keys, publishers, commitment):
+def list_accounts(
+    network, rpc_endpoint, read_rpc_endpoint, program_key, keys, publishers, commitment
+):
     program_admin = ProgramAdmin(
         network=network,
         rpc_endpoint=rpc_endpoint,
+        read_rpc_endpoint=read_rpc_endpoint,
         key_dir=keys,
         program_key=program_key,
         price_store_key=None,
         commitment=commitment,
     )
 
-    asyncio.run(program_admin.refresh_program_accounts())
+    run_with_admin(program_admin, program_admin.refresh_linked_accounts())
 
     try:
         mapping_key = program_admin.get_first_mapping_key()
@@ -289,38 +286,46 @@ def list_accounts(network, rpc_endpoint, program_key, keys, publishers, commitme
         print("Program has no mapping accounts")
         sys.exit(1)
 
-    publishers_map = parse_publishers_json(Path(publishers))
+    publisher_names = parse_publishers_json(Path(publishers))["names"]
 
-    while mapping_key != PublicKey(0):
+    while mapping_key != ZERO_PUBLIC_KEY:
         mapping_account = program_admin.get_mapping_account(mapping_key)
-        print(f"Mapping: {mapping_account.public_key}")
+        # Write each mapping's listing at once rather than one line at a time
+        lines: List[str] = [f"Mapping: {mapping_account.public_key}"]
 
         for product_key in mapping_account.data.product_account_keys:
             product_account = program_admin.get_product_account(product_key)
-            print(f"  Product: {product_account.data.metadata['symbol']}")
+            lines.append(f"  Product: {product_account.data.metadata['symbol']}")
 
-            if product_account.data.first_price_account_key != PublicKey(0):
+            if product_account.data.first_price_account_key != ZERO_PUBLIC_KEY:
                 price_account = program_admin.get_price_account(
                     product_account.data.first_price_account_key
                 )
-                print(
+                lines.append(
                     f"    Price: {price_account.data.exponent} exponent ({price_account.data.components_count} components)"
                 )
 
                 for component in price_account.data.price_components:
-                    try:
-                        name = publishers_map["names"][component.publisher_key]
-                    except KeyError:
-                        name = f"??? ({component.publisher_key})"
+                    publisher_key = component.publisher_key
+                    name = (
+                        publisher_names.get(publisher_key) or f"??? ({publisher_key})"
+                    )
 
-                    print(f"      Publisher: {name}")
+                    lines.append(f"      Publisher: {name}")
 
+        sys.stdout.write("\n".join(lines) + "\n")
         mapping_key = mapping_account.data.next_mapping_account_key
 
 
 @click.command()
 @click.option("--network", help="Solana network", envvar="NETWORK")
 @click.option("--rpc-endpoint", help="Solana RPC endpoint", envvar="RPC_ENDPOINT")
+@click.option(
+    "--read-rpc-endpoint",
+    help="Secondary Solana RPC endpoint that account reads are also sent to",
+    envvar="READ_RPC_ENDPOINT",
+    default="",
+)
 @click.option("--program-key", help="Pyth program key", envvar="PROGRAM_KEY")
 @click.option("--keys", help="Path to keys directory", envvar="KEYS")
 @click.option("--products", help="Path to reference products file", envvar="PRODUCTS")
@@ -330,10 +335,13 @@ def list_accounts(network, rpc_endpoint, program_key, keys, publishers, commitme
     envvar="COMMITMENT",
     default="finalized",
 )
-def restore_links(network, rpc_endpoint, program_key, keys, products, commitment):
+def restore_links(
+    network, rpc_endpoint, read_rpc_endpoint, program_key, keys, products, commitment
+):
     program_admin = ProgramAdmin(
         network=network,
         rpc_endpoint=rpc_endpoint,
+        read_rpc_endpoint=read_rpc_endpoint,
         key_dir=keys,
         program_key=program_key,
         price_store_key=None,
@@ -341,12 +349,12 @@ def restore_links(network, rpc_endpoint, program_key, keys, products, commitment
     )
     reference_products = parse_products_json(Path(products))
     mapping_account_counter = 0
-    jump_symbols: Dict[str, str] = {}
+    jump_symbols: Dict[str, str] = {
+        product["metadata"]["symbol"]: jump_symbol
+        for jump_symbol, product in reference_products.items()
+    }
 
-    for jump_symbol, product in reference_products.items():
-        jump_symbols[product["metadata"]["symbol"]] = jump_symbol
-
-    asyncio.run(program_admin.refresh_program_accounts())
+    run_with_admin(program_admin, program_admin.refresh_linked_accounts())
 
     try:
         mapping_key = program_admin.get_first_mapping_key()
@@ -354,7 +362,7 @@ def restore_links(network, rpc_endpoint, program_key, keys, products, commitment
         print("Program has no mapping accounts")
         sys.exit(1)
 
-    while mapping_key != PublicKey(0):
+    while mapping_key != ZERO_PUBLIC_KEY:
         mapping_account = program_admin.get_mapping_account(mapping_key)
 
         restore_symlink(
@@ -371,7 +379,7 @@ def restore_links(network, rpc_endpoint, program_key, keys, products, commitment
             )
 
             # FIXME: Assumes there is only  a single first price account
-            if product_account.data.first_price_account_key != PublicKey(0):
+            if product_account.data.first_price_account_key != ZERO_PUBLIC_KEY:
                 restore_symlink(
                     product_account.data.first_price_account_key,
                     f"price_{jump_symbol}",
@@ -385,6 +393,12 @@ def restore_links(network, rpc_endpoint, program_key, keys, products, commitment
 @click.command()
 @click.option("--network", help="Solana network", envvar="NETWORK")
 @click.option("--rpc-endpoint", help="Solana RPC endpoint", envvar="RPC_ENDPOINT")
+@click.option(
+    "--read-rpc-endpoint",
+    help="Secondary Solana RPC endpoint that account reads are also sent to",
+    envvar="READ_RPC_ENDPOINT",
+    default="",
+)
 @click.option("--program-key", help="Pyth program key", envvar="PROGRAM_KEY")
 @click.option(
     "--price-store-key",
@@ -432,9 +446,17 @@ def restore_links(network, rpc_endpoint, program_key, keys, products, commitment
     envvar="ALLOCATE_PRICE_V2",
     default="true",
 )
+@click.option(
+    "--jobs",
+    help="Maximum number of RPC requests (including transaction batches) in flight",
+    envvar="JOBS",
+    default=MAX_CONCURRENT_RPC_REQUESTS,
+    type=click.IntRange(min=1),
+)
 def sync(
     network,
     rpc_endpoint,
+    read_rpc_endpoint,
     program_key,
     price_store_key,
     keys,
@@ -447,14 +469,17 @@ def sync(
     send_transactions,
     generate_keys,
     allocate_price_v2,
+    jobs,
 ):
     program_admin = ProgramAdmin(
         network=network,
         rpc_endpoint=rpc_endpoint,
+        read_rpc_endpoint=read_rpc_endpoint,
         key_dir=keys,
         program_key=program_key,
         price_store_key=price_store_key,
         commitment=commitment,
+        max_concurrent_requests=jobs,
     )
 
     ref_products = parse_products_json(Path(products))
@@ -467,7 +492,8 @@ def sync(
         Path(authority_permissions)
     )
 
-    asyncio.run(
+    run_with_admin(
+        program_admin,
         program_admin.sync(
             ref_products=ref_products,
             ref_publishers=ref_publishers,
@@ -476,7 +502,7 @@ def sync(
             send_transactions=(send_transactions == "true"),
             generate_keys=(generate_keys == "true"),
             allocate_price_v2=(allocate_price_v2 == "true"),
-        )
+        ),
     )
 
 
@@ -518,7 +544,9 @@ def migrate_upgrade_authority(
             "program_account": PublicKey(program_key),
         }
     )
-    asyncio.run(program_admin.send_transaction([instruction], [funding_keypair]))
+    run_with_admin(
+        program_admin, program_admin.send_transaction([instruction], [funding_keypair])
+    )
 
 
 @click.command(help="Resize price accounts to the PriceAccountV2 format")
@@ -561,13 +589,134 @@ def resize_price_accounts_v2(
         commitment=commitment,
     )
 
-    asyncio.run(
+    run_with_admin(
+        program_admin,
         program_admin.resize_price_accounts_v2(
             Path(security_authority), (send_transactions == "true")
+        ),
+    )
+
+
+def batch_operation_instruction(
+    operation: Dict[str, Any], program: PublicKey, funding: Keypair, keys: str
+) -> Tuple[TransactionInstruction, List[Keypair]]:
+    """
+    Build the instruction of a batch operation, along with its signers
+    """
+    kind = operation["op"]
+
+    if kind == "delete_price":
+        product_keypair = load_keypair(PublicKey(operation["product"]), key_dir=keys)
+        price_keypair = load_keypair(PublicKey(operation["price"]), key_dir=keys)
+        instruction = instructions.delete_price(
+            program,
+            funding.public_key,
+            product_keypair.public_key,
+            price_keypair.public_key,
         )
+
+        return instruction, [product_keypair, price_keypair]
+
+    if kind == "delete_product":
+        mapping_keypair = load_keypair(PublicKey(operation["mapping"]), key_dir=keys)
+        product_keypair = load_keypair(PublicKey(operation["product"]), key_dir=keys)
+        instruction = instructions.delete_product(
+            program,
+            funding.public_key,
+            mapping_keypair.public_key,
+            product_keypair.public_key,
+        )
+
+        return instruction, [mapping_keypair, product_keypair]
+
+    if kind == "set_minimum_publishers":
+        value = operation["value"]
+
+        # bool is a subclass of int
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise RuntimeError(f"Invalid minimum publishers value: {value!r}")
+
+        price_keypair = load_keypair(PublicKey(operation["price"]), key_dir=keys)
+        instruction = instructions.set_minimum_publishers(
+            program, funding.public_key, price_keypair.public_key, value
+        )
+
+        return instruction, [price_keypair]
+
+    if kind == "toggle_publisher":
+        status = operation["status"]
+
+        if not isinstance(status, bool):
+            raise RuntimeError(f"Invalid publisher status: {status!r}")
+
+        price_keypair = load_keypair(PublicKey(operation["price"]), key_dir=keys)
+        instruction = instructions.toggle_publisher(
+            program,
+            funding.public_key,
+            price_keypair.public_key,
+            PublicKey(operation["publisher"]),
+            status,
+        )
+
+        return instruction, [price_keypair]
+
+    raise RuntimeError(f"Invalid batch operation: {kind}")
+
+
+@click.command(
+    help="Run a JSON list of delete_price, delete_product, set_minimum_publishers "
+    "and toggle_publisher operations in order, packed into as few transactions as "
+    "possible"
+)
+@click.option("--network", help="Solana network", envvar="NETWORK")
+@click.option("--rpc-endpoint", help="Solana RPC endpoint", envvar="RPC_ENDPOINT")
+@click.option("--program-key", help="Pyth program key", envvar="PROGRAM_KEY")
+@click.option("--keys", help="Path to keys directory", envvar="KEYS")
+@click.option(
+    "--commitment",
+    help="Confirmation level to use",
+    envvar="COMMITMENT",
+    default="finalized",
+)
+@click.option("--ops-file", help="Path to operations file", envvar="OPS_FILE")
+def batch(network, rpc_endpoint, program_key, keys, commitment, ops_file):
+    program_admin = ProgramAdmin(
+        network=network,
+        rpc_endpoint=rpc_endpoint,
+        key_dir=keys,
+        program_key=program_key,
+        price_store_key=None,
+        commitment=commitment,
+    )
+    program = PublicKey(program_key)
+    funding_keypair = load_keypair("funding", key_dir=keys)
+
+    with open(ops_file, encoding="utf-8") as stream:
+        operations = json.load(stream)
+
+    # Every operation is built before anything is sent, so that an invalid one
+    # fails the whole batch. The instructions go in a single list, whose
+    # transactions are sent in order, so operations may depend on earlier ones
+    # (e.g. deleting a product after its prices).
+    batch_instructions: List[TransactionInstruction] = []
+    signers: Dict[PublicKey, Keypair] = {funding_keypair.public_key: funding_keypair}
+
+    for operation in operations:
+        instruction, operation_signers = batch_operation_instruction(
+            operation, program, funding_keypair, keys
+        )
+        batch_instructions.append(instruction)
+
+        for signer in operation_signers:
+            signers[signer.public_key] = signer
+
+    run_with_admin(
+        program_admin,
+        program_admin.send_transaction(batch_instructions, list(signers.values())),
     )
 
 
+cli.add_command(batch)
 cli.add_command(delete_price)
 cli.add_command(delete_product)
 cli.add_command(list_accounts)
@@ -30,6 +30,25 @@ AUTHORITY_PERMISSIONS_PDA_SEED = b"permissions"
 # NOTE(2023-07-11): currently the loader's address is not part of our version of solana-py
 BPF_UPGRADEABLE_LOADER_ID = "BPFLoaderUpgradeab1e11111111111111111111111"
 
+# Instruction data layouts, built once as construct compiles them on creation
+COMMAND_LAYOUT = Struct("version" / Int32ul, "command" / Int32sl)
+ADD_PRICE_LAYOUT = Struct(
+    "version" / Int32ul, "command" / Int32sl, "exponent" / Int32sl, "type" / Int32ul
+)
+MIN_PUBLISHERS_LAYOUT = Struct(
+    "version" / Int32ul, "command" / Int32sl, "minimum_publishers" / Int32sl
+)
+TOGGLE_PUBLISHER_LAYOUT = Struct(
+    "version" / Int32ul, "command" / Int32sl, "publisher_key" / Bytes(32)
+)
+UPD_PERMISSIONS_LAYOUT = Struct(
+    "version" / Int32ul,
+    "command" / Int32sl,
+    "master_authority" / Bytes(32),
+    "data_curation_authority" / Bytes(32),
+    "security_authority" / Bytes(32),
+)
+
 
 def init_mapping(
     program_key: PublicKey, funding_key: PublicKey, mapping_key: PublicKey
@@ -41,8 +60,9 @@ def init_mapping(
     - funding account (signer, writable)
     - mapping account (signer, writable)
     """
-    layout = Struct("version" / Int32ul, "command" / Int32sl)
-    data = layout.build(dict(version=PROGRAM_VERSION, command=COMMAND_INIT_MAPPING))
+    data = COMMAND_LAYOUT.build(
+        dict(version=PROGRAM_VERSION, command=COMMAND_INIT_MAPPING)
+    )
 
     permissions_account = get_permissions_account(
         program_key, AUTHORITY_PERMISSIONS_PDA_SEED
@@ -73,8 +93,9 @@ def add_product(
     - mapping account (signer, writable)
     - new product account (signer, writable)
     """
-    layout = Struct("version" / Int32ul, "command" / Int32sl)
-    data = layout.build(dict(version=PROGRAM_VERSION, command=COMMAND_ADD_PRODUCT))
+    data = COMMAND_LAYOUT.build(
+        dict(version=PROGRAM_VERSION, command=COMMAND_ADD_PRODUCT)
+    )
 
     permissions_account = get_permissions_account(
         program_key, AUTHORITY_PERMISSIONS_PDA_SEED
@@ -103,8 +124,9 @@ def delete_product(
     - mapping account (signer, writable)
     - product account (signer, writable)
     """
-    layout = Struct("version" / Int32ul, "command" / Int32sl)
-    data = layout.build(dict(version=PROGRAM_VERSION, command=COMMAND_DEL_PRODUCT))
+    data = COMMAND_LAYOUT.build(
+        dict(version=PROGRAM_VERSION, command=COMMAND_DEL_PRODUCT)
+    )
 
     return TransactionInstruction(
         data=data,
@@ -130,8 +152,9 @@ def update_product(
     - funding account (signer, writable)
     - product account (signer, writable)
     """
-    layout = Struct("version" / Int32ul, "command" / Int32sl)
-    data = layout.build(dict(version=PROGRAM_VERSION, command=COMMAND_UPD_PRODUCT))
+    data = COMMAND_LAYOUT.build(
+        dict(version=PROGRAM_VERSION, command=COMMAND_UPD_PRODUCT)
+    )
     data_extra = encode_product_metadata(product_metadata)
 
     permissions_account = get_permissions_account(
@@ -165,10 +188,7 @@ def add_price(
     - product account (signer, writable)
     - new price account (signer, writable)
     """
-    layout = Struct(
-        "version" / Int32ul, "command" / Int32sl, "exponent" / Int32sl, "type" / Int32ul
-    )
-    data = layout.build(
+    data = ADD_PRICE_LAYOUT.build(
         dict(
             version=PROGRAM_VERSION,
             command=COMMAND_ADD_PRICE,
@@ -204,8 +224,9 @@ def delete_price(
     - product account (signer, writable)
     - price account (signer, writable)
     """
-    layout = Struct("version" / Int32ul, "command" / Int32sl)
-    data = layout.build(dict(version=PROGRAM_VERSION, command=COMMAND_DEL_PRICE))
+    data = COMMAND_LAYOUT.build(
+        dict(version=PROGRAM_VERSION, command=COMMAND_DEL_PRICE)
+    )
 
     return TransactionInstruction(
         data=data,
@@ -231,10 +252,7 @@ def set_minimum_publishers(
     - funding account (signer, writable)
     - price account (writable)
     """
-    layout = Struct(
-        "version" / Int32ul, "command" / Int32sl, "minimum_publishers" / Int32sl
-    )
-    data = layout.build(
+    data = MIN_PUBLISHERS_LAYOUT.build(
         dict(
             version=PROGRAM_VERSION,
             command=COMMAND_MIN_PUBLISHERS,
@@ -271,10 +289,7 @@ def toggle_publisher(
     - funding account (signer, writable)
     - price account (signer, writable)
     """
-    layout = Struct(
-        "version" / Int32ul, "command" / Int32sl, "publisher_key" / Bytes(32)
-    )
-    data = layout.build(
+    data = TOGGLE_PUBLISHER_LAYOUT.build(
         dict(
             version=PROGRAM_VERSION,
             command=(COMMAND_ADD_PUBLISHER if status else COMMAND_DEL_PUBLISHER),
@@ -318,15 +333,7 @@ def upd_permissions(
     - system program       (non-signer, readonly) - Allows the create_account() call if the permissions account is uninitialized
 
     """
-    ix_data_layout = Struct(
-        "version" / Int32ul,
-        "command" / Int32sl,
-        "master_authority" / Bytes(32),
-        "data_curation_authority" / Bytes(32),
-        "security_authority" / Bytes(32),
-    )
-
-    ix_data = ix_data_layout.build(
+    ix_data = UPD_PERMISSIONS_LAYOUT.build(
         dict(
             version=PROGRAM_VERSION,
             command=COMMAND_UPD_PERMISSIONS,
@@ -379,18 +386,12 @@ def resize_price_account_v2(
     - system program      (non-signer, readonly) - Allows the resize_account() call
     - permissions account (non-signer, readonly) - PDA of the oracle program, generated automatically, stores the permission information
     """
-    ix_data_layout = Struct(
-        "version" / Int32ul,
-        "command" / Int32sl,
-    )
-
-    ix_data = ix_data_layout.build(
+    ix_data = COMMAND_LAYOUT.build(
         dict(version=PROGRAM_VERSION, command=COMMAND_RESIZE_PRICE_ACCOUNT)
     )
 
-    [permissions_account, _bump] = PublicKey.find_program_address(
-        [AUTHORITY_PERMISSIONS_PDA_SEED],
-        program_key,
+    permissions_account = get_permissions_account(
+        program_key, AUTHORITY_PERMISSIONS_PDA_SEED
     )
 
     return TransactionInstruction(
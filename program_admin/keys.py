@@ -22,6 +22,13 @@ def generate_keypair(label: str, key_dir: Union[str, Path] = "./keys") -> Keypai
     return keypair
 
 
+def read_keypair(file_path: Path) -> Keypair:
+    with open(file_path, encoding="utf8") as file:
+        data = bytes(json.load(file))
+
+        return Keypair.from_secret_key(data)
+
+
 def load_keypair(
     label_or_pubkey: Union[str, PublicKey],
     key_dir: Union[str, Path] = "./keys",
@@ -31,12 +38,7 @@ def load_keypair(
     Read a keypair from the keys directory.
     """
     if isinstance(label_or_pubkey, PublicKey):
-        file_path = Path(key_dir) / f"account_{label_or_pubkey}.json"
-
-        with open(file_path, encoding="utf8") as file:
-            data = bytes(json.load(file))
-
-            return Keypair.from_secret_key(data)
+        return read_keypair(Path(key_dir) / f"account_{label_or_pubkey}.json")
     else:
         file_path = Path(key_dir) / f"{label_or_pubkey}.json"
 
@@ -48,10 +50,7 @@ def load_keypair(
                 f"Missing keypair (and key generation is not enabled): {file_path}"
             )
 
-        with open(file_path, encoding="utf8") as file:
-            data = bytes(json.load(file))
-
-            return Keypair.from_secret_key(data)
+        return read_keypair(file_path)
 
 
 def restore_symlink(key: PublicKey, label: str, key_dir: Union[str, Path]):
@@ -1,9 +1,10 @@
 from pathlib import Path
+from struct import Struct
 from typing import Any, Dict, List, Optional, cast
 
 import ujson as json
-from construct import Int8ul, Int32sl, Int32ul, Int64sl, Int64ul
 from solana.publickey import PublicKey
+from solders.account import Account  # pylint: disable=import-error
 from solders.rpc.responses import RpcKeyedAccount  # pylint: disable=import-error
 
 from program_admin.types import (
@@ -38,13 +39,21 @@ ACCOUNT_TYPE_PRICE = 3
 ACCOUNT_TYPE_TEST = 4
 ACCOUNT_TYPE_AUTHORITY_PERMISSION = 5
 
+# Magic number, version and account type
+ACCOUNT_HEADER = Struct("<III")
+# Fixed-size fields of each account type, skipping the account header. The
+# variable-size part of the account starts right after them.
+MAPPING_FIELDS = Struct("<12xII4x32s")
+PRODUCT_FIELDS = Struct("<12xI32s")
+PRICE_FIELDS = Struct("<12xIIiIIQQ24s24sqB7x32s32sQQQq")
+PRICE_INFO = Struct("<qQIIQ")
+
 
 def parse_mapping_data(data: bytes) -> MappingData:
-    used_size = Int32ul.parse(data[12:])
-    product_count = Int32ul.parse(data[16:])
-    next_key = PublicKey(data[24:56])
+    used_size, product_count, next_key_bytes = MAPPING_FIELDS.unpack_from(data)
+    next_key = PublicKey(next_key_bytes)
     product_keys: List[PublicKey] = []
-    offset = 56
+    offset = MAPPING_FIELDS.size
 
     for i in range(0, product_count):
         start = offset + (i * 32)
@@ -56,10 +65,10 @@ def parse_mapping_data(data: bytes) -> MappingData:
 
 
 def parse_product_data(data: bytes) -> ProductData:
-    used_size = Int32ul.parse(data[12:])
-    first_price_key = PublicKey(data[16:48])
+    used_size, first_price_key_bytes = PRODUCT_FIELDS.unpack_from(data)
+    first_price_key = PublicKey(first_price_key_bytes)
     metadata = {}
-    pointer = 48
+    pointer = PRODUCT_FIELDS.size
 
     while pointer < used_size:
         key_length = data[pointer]
@@ -80,42 +89,38 @@ def parse_product_data(data: bytes) -> ProductData:
     return ProductData(used_size, first_price_key, cast(ProductMetadata, metadata))
 
 
-def parse_price_info(data: bytes) -> PriceInfo:
-    price = Int64sl.parse(data[0:])
-    confidence = Int64ul.parse(data[8:])
-    status = Int32ul.parse(data[16:])
-    corporate_action = Int32ul.parse(data[20:])
-    publish_slot = Int64ul.parse(data[24:])
-
-    return PriceInfo(price, confidence, status, corporate_action, publish_slot)
+def parse_price_info(data: bytes, offset: int = 0) -> PriceInfo:
+    return PriceInfo(*PRICE_INFO.unpack_from(data, offset))
 
 
 # NOTE(2023-07-31): For v2 prices the parsed data does not include
 # price_cumulative values. This value is currently out-of-scope for
 # program-admin.
 def parse_price_data(data: bytes) -> PriceData:
-    used_size = Int32ul.parse(data[12:])
-    price_type = Int32ul.parse(data[16:])
-    exponent = Int32sl.parse(data[20:])
-    components_count = Int32ul.parse(data[24:])
-    quoters_count = Int32ul.parse(data[28:])
-    last_slot = Int64ul.parse(data[32:])
-    valid_slot = Int64ul.parse(data[40:])
-    ema_price = data[48:72]
-    ema_confidence = data[72:96]
-    timestamp = Int64sl.parse(data[96:])
-    min_publishers = Int8ul.parse(data[104:])
-    # int8sl: drv2 (unused)
-    # int16sl: drv3 (unused)
-    # int32sl: drv4 (unused)
-    product_account_key = PublicKey(data[112:144])
-    next_price_account_key = PublicKey(data[144:176])
-    previous_slot = Int64ul.parse(data[176:])
-    previous_price = Int64ul.parse(data[184:])
-    previous_confidence = Int64ul.parse(data[192:])
-    previous_timestamp = Int64sl.parse(data[200:])
-    aggregate = parse_price_info(data[208:240])
-    offset = 240
+    (
+        used_size,
+        price_type,
+        exponent,
+        components_count,
+        quoters_count,
+        last_slot,
+        valid_slot,
+        ema_price,
+        ema_confidence,
+        timestamp,
+        min_publishers,
+        # int8sl: drv2, int16sl: drv3 and int32sl: drv4 are unused and skipped
+        product_account_key_bytes,
+        next_price_account_key_bytes,
+        previous_slot,
+        previous_price,
+        previous_confidence,
+        previous_timestamp,
+    ) = PRICE_FIELDS.unpack_from(data)
+    product_account_key = PublicKey(product_account_key_bytes)
+    next_price_account_key = PublicKey(next_price_account_key_bytes)
+    aggregate = parse_price_info(data, PRICE_FIELDS.size)
+    offset = PRICE_FIELDS.size + PRICE_INFO.size
 
     price_components = []
 
@@ -124,11 +129,11 @@ def parse_price_data(data: bytes) -> PriceData:
         publisher_key = PublicKey(data[offset : offset + 32])
         offset += 32
 
-        aggregate_price = parse_price_info(data[offset : offset + 32])
-        offset += 32
+        aggregate_price = parse_price_info(data, offset)
+        offset += PRICE_INFO.size
 
-        latest_price = parse_price_info(data[offset : offset + 32])
-        offset += 32
+        latest_price = parse_price_info(data, offset)
+        offset += PRICE_INFO.size
 
         price_components.append(
             PriceComponent(publisher_key, aggregate_price, latest_price)
@@ -181,11 +186,11 @@ def parse_authority_permission_data(data: bytes) -> AuthorityPermissionData:
 
 # pylint: disable=too-many-return-statements
 def parse_data(data: bytes) -> Optional[AccountData]:
-    magic_number = hex(Int32ul.parse(data[0:]))
-    version = Int32ul.parse(data[4:])
-    data_type = Int32ul.parse(data[8:])
+    # Unpack the header in place, slicing from an offset to the end would copy
+    # the whole account (up to 12 KiB for price accounts) for each field.
+    magic_number, version, data_type = ACCOUNT_HEADER.unpack_from(data)
 
-    if magic_number != MAGIC_NUMBER:
+    if hex(magic_number) != MAGIC_NUMBER:
         return None
 
     if version != VERSION:
@@ -206,15 +211,21 @@ def parse_data(data: bytes) -> Optional[AccountData]:
 
 
 def parse_account(response: RpcKeyedAccount) -> Optional[PythAccount]:
-    account_data = parse_data(response.account.data)
+    return parse_account_info(PublicKey(response.pubkey), response.account)
+
+
+def parse_account_info(
+    public_key: PublicKey, account: Account
+) -> Optional[PythAccount]:
+    account_data = parse_data(account.data)
 
     if not account_data:
         return None
 
     account_args: Dict[str, Any] = {
-        "public_key": PublicKey(response.pubkey),
-        "owner": PublicKey(response.account.owner),
-        "lamports": response.account.lamports,
+        "public_key": public_key,
+        "owner": PublicKey(account.owner),
+        "lamports": account.lamports,
         "data": account_data,
     }
 
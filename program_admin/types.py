@@ -40,7 +40,7 @@ class ReferenceAuthorityPermissions(TypedDict):
 ReferenceOverrides = Dict[str, Dict[str, bool]]
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingData:
     used_size: int
     product_count: int
@@ -64,7 +64,7 @@ ProductMetadata = TypedDict(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductData:
     used_size: int
     first_price_account_key: PublicKey
@@ -74,7 +74,7 @@ class ProductData:
         return f"ProductData(symbol={self.metadata.get('symbol', '???')})"
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceInfo:
     price: int
     confidence: int
@@ -83,14 +83,14 @@ class PriceInfo:
     publish_slot: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceComponent:
     publisher_key: PublicKey
     aggregate_price: PriceInfo
     latest_price: PriceInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     used_size: int
     price_type: int
@@ -116,7 +116,7 @@ class PriceData:
         return f"PriceData(product_key={str(self.product_account_key)[0:5]}...)"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthorityPermissionData:
     master_authority: PublicKey
     data_curation_authority: PublicKey
@@ -1,11 +1,11 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import Collection, Dict, List, Set
 
 from solana.blockhash import Blockhash
-from solana.keypair import Keypair
 from solana.publickey import PublicKey
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
-from solana.transaction import Transaction
+from solana.transaction import Transaction, TransactionInstruction
 
 from program_admin.types import (
     Network,
@@ -21,7 +21,16 @@ PRICE_ACCOUNT_V2_SIZE = 12576
 PRICE_V1_COMP_COUNT = 32
 PRICE_V2_COMP_COUNT = 128
 PRODUCT_ACCOUNT_SIZE = 512
+PUBLIC_KEY_SIZE = 32
+SIGNATURE_SIZE = 64
 SOL_LAMPORTS = pow(10, 9)
+# Null key ending linked lists, built once since comparisons happen in loops
+ZERO_PUBLIC_KEY = PublicKey(0)
+
+# Size of a legacy transaction with no instructions, signed by its fee payer:
+# signature count and signature, message header, account key count and fee
+# payer key, recent blockhash and instruction count
+EMPTY_TRANSACTION_SIZE = 1 + SIGNATURE_SIZE + 3 + 1 + PUBLIC_KEY_SIZE + 32 + 1
 
 
 async def recent_blockhash(client: AsyncClient) -> Blockhash:
@@ -35,8 +44,7 @@ async def recent_blockhash(client: AsyncClient) -> Blockhash:
     return Blockhash(str(blockhash_response.value.blockhash))
 
 
-async def account_exists(rpc_endpoint: str, key: PublicKey) -> bool:
-    client = AsyncClient(rpc_endpoint)
+async def account_exists(client: AsyncClient, key: PublicKey) -> bool:
     response = await client.get_account_info(key)
 
     return bool(response.value)
@@ -44,14 +52,74 @@ async def account_exists(rpc_endpoint: str, key: PublicKey) -> bool:
 
 def compute_transaction_size(transaction: Transaction) -> int:
     """
-    Returns the total over-the-wire size of a transaction
+    Returns the total over-the-wire size of a transaction, whether it is signed
+    or not (and even if it does not fit in a packet)
+    """
+    message = transaction.serialize_message()
+    signature_count = message[0]  # First byte of the message header
+
+    return (
+        compact_u16_size(signature_count)
+        + SIGNATURE_SIZE * signature_count
+        + len(message)
+    )
+
+
+def compact_u16_size(value: int) -> int:
+    """
+    Returns the number of bytes used by the compact-u16 encoding of a value
     """
+    size = 1
+
+    while value >= 0x80:
+        value >>= 7
+        size += 1
 
-    return len(transaction.serialize())
+    return size
+
+
+def compute_instruction_size(
+    instruction: TransactionInstruction,
+    account_keys: Set[PublicKey],
+    signer_keys: Set[PublicKey],
+    instruction_count: int,
+) -> int:
+    """
+    Returns the number of bytes an instruction adds to the over-the-wire size
+    of a transaction whose message already references account_keys, is signed
+    by signer_keys and holds instruction_count instructions.
+    """
+    instruction_keys = {account.pubkey for account in instruction.keys}
+    instruction_keys.add(instruction.program_id)
+    instruction_signers = {
+        account.pubkey for account in instruction.keys if account.is_signer
+    }
+    key_count = len(account_keys)
+    new_key_count = len(instruction_keys - account_keys)
+    signer_count = len(signer_keys)
+    new_signer_count = len(instruction_signers - signer_keys)
+
+    return (
+        PUBLIC_KEY_SIZE * new_key_count
+        + SIGNATURE_SIZE * new_signer_count
+        # Growth of the compact-u16 length prefixes of the message arrays
+        + compact_u16_size(key_count + new_key_count)
+        - compact_u16_size(key_count)
+        + compact_u16_size(signer_count + new_signer_count)
+        - compact_u16_size(signer_count)
+        + compact_u16_size(instruction_count + 1)
+        - compact_u16_size(instruction_count)
+        + 1  # Program id index
+        + compact_u16_size(len(instruction.keys))
+        + len(instruction.keys)
+        + compact_u16_size(len(instruction.data))
+        + len(instruction.data)
+    )
 
 
 def encode_product_metadata(data: Dict[str, str]) -> bytes:
-    buffer = b""
+    # Extend a bytearray in place, concatenating bytes copies the whole buffer
+    buffer = bytearray()
 
     for key, value in data.items():
         key_bytes = key.encode("utf8")
@@ -61,13 +129,15 @@ def encode_product_metadata(data: Dict[str, str]) -> bytes:
 
         buffer += key_len + key_bytes + value_len + value_bytes
 
-    return buffer
+    return bytes(buffer)
 
 
-def sort_mapping_account_keys(accounts: List[PythMappingAccount]) -> List[PublicKey]:
+def sort_mapping_account_keys(
+    accounts: Collection[PythMappingAccount],
+) -> List[PublicKey]:
     """
-    Takes a list of mapping accounts and returns a list of mapping account keys
-    matching the order of the mapping linked list
+    Takes a collection of mapping accounts and returns a list of mapping account
+    keys matching the order of the mapping linked list
     """
     if not accounts:
         return []
@@ -81,7 +151,7 @@ def sort_mapping_account_keys(accounts: List[PythMappingAccount]) -> List[Public
         this_key = account.public_key
         next_key = account.data.next_mapping_account_key
 
-        if next_key == PublicKey(0):
+        if next_key == ZERO_PUBLIC_KEY:
             last_key = this_key
 
         previous_keys[next_key] = this_key
@@ -89,17 +159,20 @@ def sort_mapping_account_keys(accounts: List[PythMappingAccount]) -> List[Public
     if not last_key:
         raise RuntimeError("The linked list has no end")
 
-    # Now traverse the inverted linked list and build a list in the right order
+    # Now traverse the inverted linked list from the last key, and reverse it
+    # at the end (appending is O(1), unlike inserting at the front)
     sorted_keys: List[PublicKey] = []
     current: PublicKey = last_key
 
     while len(accounts) != len(sorted_keys):
-        sorted_keys.insert(0, current)
+        sorted_keys.append(current)
 
         # There is no previous key to the first key
         if previous_keys.get(current):
             current = previous_keys[current]
 
+    sorted_keys.reverse()
+
     return sorted_keys
 
 
@@ -120,28 +193,9 @@ def apply_overrides(
     return overridden_permissions
 
 
-def get_actual_signers(
-    signers: List[Keypair], transaction: Transaction
-) -> List[Keypair]:
-    """
-    Given a list of keypairs and a transaction, returns the keypairs that actually need to sign the transaction,
-    i.e. those whose pubkey appears in at least one of the instructions as a signer.
-    """
-    actual_signers = []
-    for signer in signers:
-        instruction_has_signer = [
-            any(
-                signer.public_key == account.pubkey and account.is_signer
-                for account in instruction.keys
-            )
-            for instruction in transaction.instructions
-        ]
-        if any(instruction_has_signer):
-            actual_signers.append(signer)
-
-    return actual_signers
-
-
+# Deriving a program address hashes candidate seeds until one is off the curve,
+# which is slow in pure Python, and every instruction needs this account.
+@lru_cache(maxsize=None)
 def get_permissions_account(program_key, seed):
     [permissions_account, _bump] = PublicKey.find_program_address(
         [seed],
@@ -1,8 +1,10 @@
 import json
 
 from click.testing import CliRunner
+from solana.publickey import PublicKey
 
-from program_admin import cli
+from program_admin import ProgramAdmin, cli, instructions
+from program_admin.keys import generate_keypair
 
 PERMISSIONS_ACCOUNT = "C3dX9x4N9HYq9TTPj1gH3xFBR6JmE8cBJiLPgxXcZGiv"
 
@@ -84,3 +86,185 @@ def test_update_product():
     json_data = json.loads(result.output)
     for key in ["program_id", "data", "accounts"]:
         assert key in json_data[0].keys()
+
+
+def run_batch(tmp_path, operations):
+    ops_file = tmp_path / "ops.json"
+    ops_file.write_text(json.dumps(operations))
+
+    return CliRunner().invoke(
+        cli.batch,
+        [
+            "--network",
+            "localhost",
+            "--program-key",
+            "3LCB76Eyh4F47g5Vq2jYgDMiAuUNyUbysyMavhVNABEa",
+            "--keys",
+            str(tmp_path),
+            "--ops-file",
+            str(ops_file),
+        ],
+    )
+
+
+def test_batch(tmp_path, monkeypatch):
+    program = PublicKey("3LCB76Eyh4F47g5Vq2jYgDMiAuUNyUbysyMavhVNABEa")
+    funding = generate_keypair("funding", tmp_path)
+    mapping = generate_keypair("mapping_0", tmp_path)
+    product = generate_keypair("product_BTCUSD", tmp_path)
+    price = generate_keypair("price_BTCUSD", tmp_path)
+    publisher = PublicKey("6bRsDGmuSfUCND9vZioUbWfB56dkrCqNE8f2DW7eNU5E")
+    sent = []
+
+    async def send_transaction(_self, batch_instructions, signers):
+        sent.append((batch_instructions, signers))
+
+    monkeypatch.setattr(ProgramAdmin, "send_transaction", send_transaction)
+
+    result = run_batch(
+        tmp_path,
+        [
+            {
+                "op": "toggle_publisher",
+                "price": str(price.public_key),
+                "publisher": str(publisher),
+                "status": False,
+            },
+            {
+                "op": "set_minimum_publishers",
+                "price": str(price.public_key),
+                "value": 3,
+            },
+            {
+                "op": "delete_price",
+                "product": str(product.public_key),
+                "price": str(price.public_key),
+            },
+            {
+                "op": "delete_product",
+                "mapping": str(mapping.public_key),
+                "product": str(product.public_key),
+            },
+        ],
+    )
+
+    assert result.exit_code == 0
+
+    # Operations are sent in a single, ordered instruction list
+    [(batch_instructions, signers)] = sent
+
+    assert batch_instructions == [
+        instructions.toggle_publisher(
+            program, funding.public_key, price.public_key, publisher, False
+        ),
+        instructions.set_minimum_publishers(
+            program, funding.public_key, price.public_key, 3
+        ),
+        instructions.delete_price(
+            program, funding.public_key, product.public_key, price.public_key
+        ),
+        instructions.delete_product(
+            program, funding.public_key, mapping.public_key, product.public_key
+        ),
+    ]
+    assert [signer.public_key for signer in signers] == [
+        funding.public_key,
+        price.public_key,
+        product.public_key,
+        mapping.public_key,
+    ]
+
+
+def test_batch_price_operations(tmp_path, monkeypatch):
+    program = PublicKey("3LCB76Eyh4F47g5Vq2jYgDMiAuUNyUbysyMavhVNABEa")
+    funding = generate_keypair("funding", tmp_path)
+    price = generate_keypair("price_BTCUSD", tmp_path)
+    publisher = PublicKey("6bRsDGmuSfUCND9vZioUbWfB56dkrCqNE8f2DW7eNU5E")
+    sent = []
+
+    async def send_transaction(_self, batch_instructions, signers):
+        sent.append((batch_instructions, signers))
+
+    monkeypatch.setattr(ProgramAdmin, "send_transaction", send_transaction)
+
+    result = run_batch(
+        tmp_path,
+        [
+            {
+                "op": "toggle_publisher",
+                "price": str(price.public_key),
+                "publisher": str(publisher),
+                "status": True,
+            },
+            {
+                "op": "set_minimum_publishers",
+                "price": str(price.public_key),
+                "value": 5,
+            },
+        ],
+    )
+
+    assert result.exit_code == 0
+
+    [(batch_instructions, signers)] = sent
+
+    assert batch_instructions == [
+        instructions.toggle_publisher(
+            program, funding.public_key, price.public_key, publisher, True
+        ),
+        instructions.set_minimum_publishers(
+            program, funding.public_key, price.public_key, 5
+        ),
+    ]
+    # The price account signs both instructions
+    assert [signer.public_key for signer in signers] == [
+        funding.public_key,
+        price.public_key,
+    ]
+
+
+def test_batch_invalid_operations(tmp_path, monkeypatch):
+    generate_keypair("funding", tmp_path)
+    price = str(generate_keypair("price_BTCUSD", tmp_path).public_key)
+    publisher = "6bRsDGmuSfUCND9vZioUbWfB56dkrCqNE8f2DW7eNU5E"
+    sent = []
+
+    async def send_transaction(_self, batch_instructions, signers):
+        sent.append((batch_instructions, signers))
+
+    monkeypatch.setattr(ProgramAdmin, "send_transaction", send_transaction)
+
+    for operation, error in [
+        (
+            {"op": "toggle_publisher", "price": price, "publisher": publisher},
+            "'status'",
+        ),
+        (
+            {
+                "op": "toggle_publisher",
+                "price": price,
+                "publisher": publisher,
+                "status": "false",
+            },
+            "Invalid publisher status: 'false'",
+        ),
+        (
+            {"op": "set_minimum_publishers", "price": price, "value": "3"},
+            "Invalid minimum publishers value: '3'",
+        ),
+        (
+            {"op": "set_minimum_publishers", "price": price, "value": True},
+            "Invalid minimum publishers value: True",
+        ),
+        ({"op": "add_price", "price": price}, "Invalid batch operation: add_price"),
+    ]:
+        result = run_batch(
+            tmp_path,
+            [{"op": "set_minimum_publishers", "price": price, "value": 3}, operation],
+        )
+
+        assert result.exit_code != 0
+        assert error in str(result.exception)
+
+    # Nothing is sent when any operation is invalid
+    assert not sent
@@ -0,0 +1,156 @@
+from solana.keypair import Keypair
+
+from program_admin.parsing import (
+    ACCOUNT_TYPE_MAPPING,
+    ACCOUNT_TYPE_PRICE,
+    ACCOUNT_TYPE_PRODUCT,
+    parse_data,
+)
+from program_admin.types import (
+    MappingData,
+    PriceComponent,
+    PriceData,
+    PriceInfo,
+    ProductData,
+)
+from program_admin.util import (
+    MAPPING_ACCOUNT_SIZE,
+    PRICE_ACCOUNT_V2_SIZE,
+    PRODUCT_ACCOUNT_SIZE,
+    encode_product_metadata,
+)
+
+# Field offsets below follow the account layouts of the Pyth oracle program
+# (oracle.h), independently of the struct formats used by the parser.
+
+
+def put(buffer: bytearray, offset: int, value: int, size: int, signed=False):
+    buffer[offset : offset + size] = value.to_bytes(size, "little", signed=signed)
+
+
+def account_buffer(size: int, account_type: int, used_size: int) -> bytearray:
+    buffer = bytearray(size)
+    put(buffer, 0, 0xA1B2C3D4, 4)  # Magic number
+    put(buffer, 4, 2, 4)  # Version
+    put(buffer, 8, account_type, 4)
+    put(buffer, 12, used_size, 4)
+
+    return buffer
+
+
+def put_price_info(buffer: bytearray, offset: int, price_info: PriceInfo):
+    put(buffer, offset, price_info.price, 8, signed=True)
+    put(buffer, offset + 8, price_info.confidence, 8)
+    put(buffer, offset + 16, price_info.status, 4)
+    put(buffer, offset + 20, price_info.corporate_action, 4)
+    put(buffer, offset + 24, price_info.publish_slot, 8)
+
+
+def test_parse_mapping_data():
+    next_key = Keypair().public_key
+    product_keys = [Keypair().public_key for _ in range(3)]
+    buffer = account_buffer(MAPPING_ACCOUNT_SIZE, ACCOUNT_TYPE_MAPPING, 56 + 3 * 32)
+    put(buffer, 16, len(product_keys), 4)
+    buffer[24:56] = bytes(next_key)
+
+    for index, product_key in enumerate(product_keys):
+        buffer[56 + index * 32 : 88 + index * 32] = bytes(product_key)
+
+    assert parse_data(bytes(buffer)) == MappingData(
+        used_size=56 + 3 * 32,
+        product_count=3,
+        next_mapping_account_key=next_key,
+        product_account_keys=product_keys,
+    )
+
+
+def test_parse_product_data():
+    first_price_key = Keypair().public_key
+    metadata = {"symbol": "Crypto.BTC/USD", "asset_type": "Crypto", "base": "BTC"}
+    encoded_metadata = encode_product_metadata(metadata)
+    buffer = account_buffer(
+        PRODUCT_ACCOUNT_SIZE, ACCOUNT_TYPE_PRODUCT, 48 + len(encoded_metadata)
+    )
+    buffer[16:48] = bytes(first_price_key)
+    buffer[48 : 48 + len(encoded_metadata)] = encoded_metadata
+
+    assert parse_data(bytes(buffer)) == ProductData(
+        used_size=48 + len(encoded_metadata),
+        first_price_account_key=first_price_key,
+        metadata=metadata,
+    )
+
+
+def test_parse_price_data():
+    product_key = Keypair().public_key
+    next_price_key = Keypair().public_key
+    ema_price = bytes(range(24))
+    ema_confidence = bytes(range(24, 48))
+    aggregate = PriceInfo(-123456789, 1000, 1, 0, 987654)
+    components = [
+        PriceComponent(
+            Keypair().public_key,
+            PriceInfo(-100 - index, 10 + index, 1, 0, 500 + index),
+            PriceInfo(-200 - index, 20 + index, 2, 1, 600 + index),
+        )
+        for index in range(2)
+    ]
+    buffer = account_buffer(PRICE_ACCOUNT_V2_SIZE, ACCOUNT_TYPE_PRICE, 240 + 2 * 96)
+    put(buffer, 16, 1, 4)  # Price type
+    put(buffer, 20, -8, 4, signed=True)  # Exponent
+    put(buffer, 24, len(components), 4)
+    put(buffer, 28, 5, 4)  # Quoters
+    put(buffer, 32, 1001, 8)  # Last slot
+    put(buffer, 40, 1002, 8)  # Valid slot
+    buffer[48:72] = ema_price
+    buffer[72:96] = ema_confidence
+    put(buffer, 96, -1700000000, 8, signed=True)  # Timestamp
+    put(buffer, 104, 3, 1)  # Minimum publishers
+    # Unused drv2, drv3 and drv4 are set to make sure they are skipped
+    buffer[105:112] = b"\xff" * 7
+    buffer[112:144] = bytes(product_key)
+    buffer[144:176] = bytes(next_price_key)
+    put(buffer, 176, 1000, 8)  # Previous slot
+    put(buffer, 184, 42, 8)  # Previous price
+    put(buffer, 192, 7, 8)  # Previous confidence
+    put(buffer, 200, -1600000000, 8, signed=True)  # Previous timestamp
+    put_price_info(buffer, 208, aggregate)
+
+    for index, component in enumerate(components):
+        offset = 240 + index * 96
+        buffer[offset : offset + 32] = bytes(component.publisher_key)
+        put_price_info(buffer, offset + 32, component.aggregate_price)
+        put_price_info(buffer, offset + 64, component.latest_price)
+
+    assert parse_data(bytes(buffer)) == PriceData(
+        used_size=240 + 2 * 96,
+        price_type=1,
+        exponent=-8,
+        components_count=2,
+        quoters_count=5,
+        last_slot=1001,
+        valid_slot=1002,
+        ema_price=ema_price,
+        ema_confidence=ema_confidence,
+        timestamp=-1700000000,
+        min_publishers=3,
+        product_account_key=product_key,
+        next_price_account_key=next_price_key,
+        previous_slot=1000,
+        previous_price=42,
+        previous_confidence=7,
+        previous_timestamp=-1600000000,
+        aggregate=aggregate,
+        price_components=components,
+    )
+
+
+def test_parse_data_ignores_other_accounts():
+    buffer = account_buffer(PRODUCT_ACCOUNT_SIZE, ACCOUNT_TYPE_PRODUCT, 48)
+
+    put(buffer, 0, 0xDEADBEEF, 4)
+    assert parse_data(bytes(buffer)) is None
+
+    put(buffer, 0, 0xA1B2C3D4, 4)
+    put(buffer, 4, 1, 4)
+    assert parse_data(bytes(buffer)) is None
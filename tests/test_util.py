@@ -0,0 +1,160 @@
+from typing import List, Set
+
+from solana.blockhash import Blockhash
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import (
+    PACKET_DATA_SIZE,
+    AccountMeta,
+    Transaction,
+    TransactionInstruction,
+)
+
+from program_admin import ProgramAdmin
+from program_admin.util import (
+    EMPTY_TRANSACTION_SIZE,
+    compute_instruction_size,
+    compute_transaction_size,
+)
+
+BLOCKHASH = Blockhash("EtWTRABZaYq6iMfeYKouRu166VU2xqa1wcaWoxPkrZBG")
+PROGRAM_KEY = Keypair().public_key
+
+
+def build_instruction(
+    signer_keys: List[PublicKey],
+    readonly_keys: List[PublicKey],
+    data_size: int,
+    program_key: PublicKey = PROGRAM_KEY,
+) -> TransactionInstruction:
+    return TransactionInstruction(
+        keys=[
+            AccountMeta(pubkey=key, is_signer=True, is_writable=True)
+            for key in signer_keys
+        ]
+        + [
+            AccountMeta(pubkey=key, is_signer=False, is_writable=False)
+            for key in readonly_keys
+        ],
+        program_id=program_key,
+        data=bytes(data_size),
+    )
+
+
+def assert_running_size(
+    fee_payer: PublicKey, instructions: List[TransactionInstruction]
+):
+    """
+    Add instructions to a transaction one at a time and check that the running
+    size (as computed by _partition_instructions) matches its serialized size
+    after each addition.
+    """
+    transaction = Transaction(recent_blockhash=BLOCKHASH, fee_payer=fee_payer)
+    transaction_size = EMPTY_TRANSACTION_SIZE
+    account_keys: Set[PublicKey] = {fee_payer}
+    signer_keys: Set[PublicKey] = {fee_payer}
+
+    for index, instruction in enumerate(instructions):
+        transaction_size += compute_instruction_size(
+            instruction, account_keys, signer_keys, index
+        )
+        account_keys.add(instruction.program_id)
+        account_keys.update(account.pubkey for account in instruction.keys)
+        signer_keys.update(
+            account.pubkey for account in instruction.keys if account.is_signer
+        )
+        transaction.add(instruction)
+
+        assert transaction_size == compute_transaction_size(transaction)
+
+
+def test_compute_transaction_size():
+    fee_payer = Keypair()
+    signer = Keypair()
+    transaction = Transaction(
+        recent_blockhash=BLOCKHASH, fee_payer=fee_payer.public_key
+    )
+    transaction.add(
+        build_instruction([fee_payer.public_key, signer.public_key], [], 10)
+    )
+    transaction.sign(fee_payer, signer)
+
+    assert compute_transaction_size(transaction) == len(transaction.serialize())
+
+
+def test_compute_instruction_size():
+    fee_payer = Keypair().public_key
+    signers = [Keypair().public_key for _ in range(3)]
+    readonly = [Keypair().public_key for _ in range(3)]
+
+    assert_running_size(
+        fee_payer,
+        [
+            # Only the fee payer and the program
+            build_instruction([fee_payer], [], 0),
+            # New signers and new keys
+            build_instruction([fee_payer, signers[0]], readonly[:2], 1),
+            # Known keys only
+            build_instruction([signers[0]], readonly[:1], 16),
+            # A new signer among known keys, and data with a 2-byte length
+            build_instruction([signers[1]], readonly[:2], 200),
+            # A new program
+            build_instruction([signers[2]], readonly[2:], 3, Keypair().public_key),
+        ],
+    )
+
+
+def test_compute_instruction_size_compact_u16_growth():
+    fee_payer = Keypair().public_key
+
+    # 64 instructions with 2 new signers each, so that both the account key
+    # count and the signature count cross 127 (a message holds at most 256
+    # account keys)
+    assert_running_size(
+        fee_payer,
+        [
+            build_instruction([Keypair().public_key for _ in range(2)], [], index)
+            for index in range(64)
+        ],
+    )
+
+    # More than 127 instructions
+    assert_running_size(
+        fee_payer, [build_instruction([fee_payer], [], 1) for _ in range(130)]
+    )
+
+
+def test_partition_instructions():
+    program_admin = ProgramAdmin(
+        network="localhost",
+        key_dir="./keys",
+        program_key=str(PROGRAM_KEY),
+        price_store_key=None,
+        commitment="confirmed",
+    )
+    fee_payer = Keypair()
+    signers = [fee_payer] + [Keypair() for _ in range(20)]
+    instructions = [
+        build_instruction(
+            [fee_payer.public_key, signers[index % 20 + 1].public_key],
+            [Keypair().public_key],
+            index * 7 % 150,
+        )
+        for index in range(60)
+    ]
+
+    # pylint: disable=protected-access
+    groups = program_admin._partition_instructions(instructions, fee_payer.public_key)
+
+    assert [ix for group in groups for ix in group] == instructions
+
+    for index, group in enumerate(groups):
+        transaction = program_admin._build_transaction(group, signers, BLOCKHASH)
+
+        assert len(transaction.serialize()) <= PACKET_DATA_SIZE
+
+        # Each transaction is as full as it can be
+        if index + 1 < len(groups):
+            transaction.add(groups[index + 1][0])
+
+            assert compute_transaction_size(transaction) > PACKET_DATA_SIZE